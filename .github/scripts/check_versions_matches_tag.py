@@ -4,15 +4,34 @@ import sys
 
 PYPROJECT = pathlib.Path("pyproject.toml")
 
+_TAG_RE = re.compile(r"refs/tags/v?(\d+\.\d+\.\d+)")
+
+
+def _scan_project_version(text: str) -> str | None:
+    # Linear scan of the [project] table: version = "0.4.0"
+    _, found, rest = text.partition("[project]")
+    if not found:
+        return None
+    for line in rest.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("["):
+            break
+        key, sep, value = stripped.partition("=")
+        if sep and key.strip() == "version":
+            _, quote, tail = value.partition('"')
+            version, closing, _ = tail.partition('"')
+            if quote and closing and version:
+                return version
+    return None
+
 
 def get_version_from_pyproject() -> str:
     text = PYPROJECT.read_text(encoding="utf-8")
-    # Match: version = "0.4.0" under [project]
-    m = re.search(r'(?m)^\s*version\s*=\s*"([^"]+)"', text)
-    if not m:
+    version = _scan_project_version(text)
+    if version is None:
         print("Could not find [project].version in pyproject.toml", file=sys.stderr)
         sys.exit(1)
-    return m.group(1)
+    return version
 
 
 def main() -> None:
@@ -22,7 +41,7 @@ def main() -> None:
         sys.exit(1)
 
     ref = sys.argv[1]
-    m = re.match(r"refs/tags/v?(\d+\.\d+\.\d+)$", ref)
+    m = _TAG_RE.fullmatch(ref)
     if not m:
         print(f"Ref {ref!r} is not a semantic version tag like v1.2.3", file=sys.stderr)
         sys.exit(1)
@@ -2,6 +2,11 @@
 """Nox sessions for testing, linting, type checking, and building."""
 from __future__ import annotations
 from pathlib import Path
+import functools
+import hashlib
+import json
+import os
+import runpy
 import shutil
 import sys
 import zipfile
@@ -12,21 +17,82 @@ except ModuleNotFoundError:  # Python <3.11
     import tomli as tomllib  # type: ignore[no-redef]
 
 import nox
-from nox.command import CommandFailed
 
 ROOT = Path(__file__).resolve().parent
+# Local wheels built by the build_wheelhouse session; see _wheelhouse_args().
+WHEELHOUSE = ROOT / ".nox" / "wheelhouse"
+
+
+def _wheelhouse_args() -> list[str]:
+    """Return pip arguments that prefer wheels from WHEELHOUSE, if it exists."""
+    if WHEELHOUSE.is_dir():
+        return ["--find-links", str(WHEELHOUSE)]
+    return []
+
+
+def _cached_install(
+    session: nox.Session, *args: str, key_files: tuple[str, ...] = ("pyproject.toml",)
+) -> None:
+    """Run ``session.install(*args)`` unless this venv already has them.
+
+    Installs are recorded per argument list in ``.install_cache.json`` inside
+    the session's virtualenv, keyed on the contents of *key_files*, so a
+    reused venv skips pip entirely until the dependency metadata changes.
+    """
+    location = getattr(session.virtualenv, "location", None)
+    if not location:
+        session.install(*_wheelhouse_args(), *args)
+        return
+
+    digest = hashlib.sha256()
+    for name in key_files:
+        digest.update((ROOT / name).read_bytes())
+    fingerprint = digest.hexdigest()
+    key = " ".join(args)
+
+    cache_path = Path(location) / ".install_cache.json"
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get(key) == fingerprint:
+        session.log(f"Skipping install of {key!r}: already installed.")
+        return
+
+    session.install(*_wheelhouse_args(), *args)
+    cache[key] = fingerprint
+    cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _xdist_args(session: nox.Session) -> list[str]:
+    """Install pytest-xdist and return its pytest arguments.
+
+    Set NOX_DISABLE_XDIST=1 to run the suite serially, e.g. when debugging.
+    """
+    if os.environ.get("NOX_DISABLE_XDIST"):
+        return []
+    _cached_install(session, "pytest-xdist")
+    # loadfile keeps each test module on one worker, so module-level caches
+    # (built dictionaries, wordfreq probes) are shared by its tests.
+    return ["-n", "auto", "--dist=loadfile"]
 
 
 def _run_pytest(session: nox.Session) -> None:
     _install_project_editable(session)
-    session.install("pytest")
-    session.run("pytest", *session.posargs)
+    _cached_install(session, "pytest")
+    session.run("pytest", *_xdist_args(session), *session.posargs)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_pyproject() -> dict:
+    """Parse pyproject.toml once; helpers share the result."""
+    return tomllib.loads((ROOT / "pyproject.toml").read_text(encoding="utf-8"))
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_version() -> str:
     """Read and return the project version from pyproject.toml."""
-    data = tomllib.loads((ROOT / "pyproject.toml").read_text(encoding="utf-8"))
-    return data["project"]["version"]
+    return _load_pyproject()["project"]["version"]
 
 
 def _detect_package_name() -> str:
@@ -47,6 +113,8 @@ def _detect_package_name() -> str:
 
 
 PACKAGE = _detect_package_name()
+# Decided up front so installs never pay for a failing pip run on ".[dev]".
+_HAS_DEV_EXTRA = "dev" in _load_pyproject()["project"].get("optional-dependencies", {})
 CODE_LOCATIONS = ("src", "tests")
 
 # When running bare `nox`, run tests and lint by default.
@@ -55,12 +123,10 @@ nox.options.sessions = ("tests", "lint")
 
 def _install_project_editable(session: nox.Session) -> None:
     """Install the project in editable mode, with dev extras if available."""
-    try:
-        session.install("-e", ".[dev]")
-    except CommandFailed:
-        session.install("-e", ".")
+    _cached_install(session, "-e", ".[dev]" if _HAS_DEV_EXTRA else ".")
 
 
+@functools.lru_cache(maxsize=1)
 def _find_build_script() -> Path:
     """Find an existing build script in the repo root (e.g. build_release.py)."""
     candidates = sorted(ROOT.glob("build*.py"))
@@ -72,6 +138,29 @@ def _find_build_script() -> Path:
     return candidates[0]
 
 
+# Pre-build wheels for the development toolchain into .nox/wheelhouse.
+@nox.session
+def build_wheelhouse(session: nox.Session) -> None:
+    """Build wheels for the dev dependencies so other sessions reuse them.
+
+    Once the wheelhouse exists, every cached install passes ``--find-links``
+    to pip, which then installs these local wheels instead of downloading or
+    rebuilding them. Delete .nox/wheelhouse to go back to the index only.
+    """
+    session.install("pip", "wheel")
+    session.run(
+        "python",
+        "-m",
+        "pip",
+        "wheel",
+        "--wheel-dir",
+        str(WHEELHOUSE),
+        ".[dev]",
+        "pytest-xdist",
+        "pytest-cov",
+    )
+
+
 # Run the test suite with pytest.
 @nox.session
 def tests(session: nox.Session) -> None:
@@ -83,12 +172,13 @@ def tests(session: nox.Session) -> None:
 @nox.session
 def coverage(session: nox.Session) -> None:
     _install_project_editable(session)
-    session.install("pytest", "coverage", "pytest-cov")
+    _cached_install(session, "pytest", "coverage", "pytest-cov")
     session.run("coverage", "erase")
     # Use pytest-cov so configuration from .coveragerc is respected while keeping
-    # the invocation simple and reproducible.
+    # the invocation simple and reproducible; it also combines xdist workers' data.
     session.run(
         "pytest",
+        *_xdist_args(session),
         f"--cov={PACKAGE}",
         "--cov-report=term",
         "--cov-report=xml",
@@ -101,14 +191,14 @@ def coverage(session: nox.Session) -> None:
 # Run Ruff in check-only mode (no changes).
 @nox.session
 def lint(session: nox.Session) -> None:
-    session.install("ruff")
+    _cached_install(session, "ruff")
     session.run("ruff", "check", *CODE_LOCATIONS)
 
 
 # Run Ruff with auto-fix, then Black formatting.
 @nox.session
 def format(session: nox.Session) -> None:
-    session.install("ruff", "black")
+    _cached_install(session, "ruff", "black")
     session.run("ruff", "check", "--fix", *CODE_LOCATIONS)
     session.run("black", *CODE_LOCATIONS)
 
@@ -117,7 +207,7 @@ def format(session: nox.Session) -> None:
 @nox.session
 def typecheck(session: nox.Session) -> None:
     _install_project_editable(session)
-    session.install("mypy")
+    _cached_install(session, "mypy")
     session.run("mypy", f"src/{PACKAGE}", *session.posargs)
 
 
@@ -126,10 +216,11 @@ def typecheck(session: nox.Session) -> None:
 def build(session: nox.Session) -> None:
     _install_project_editable(session)
     # Ensure optional dictionary backend is available so wordfreq
-    # support (and its data files) are included in GUI builds.
+    # support (and its data files) are included in GUI builds. Not cached:
+    # a non-editable install must pick up the current sources every time.
     session.install(".[dictionaries]")
     # PyInstaller (and PyQt6) are required by build_release.py for the GUI binary.
-    session.install("pyinstaller", "PyQt6")
+    _cached_install(session, "pyinstaller", "PyQt6")
     script = _find_build_script()
     session.run("python", str(script))
 
@@ -138,7 +229,7 @@ def build(session: nox.Session) -> None:
 @nox.session
 def build_package(session: nox.Session) -> None:
     _install_project_editable(session)
-    session.install("build")
+    _cached_install(session, "build")
 
     dist_dir = ROOT / "dist"
     build_dir = ROOT / "build"
@@ -156,7 +247,7 @@ def build_dist(session: nox.Session) -> None:
         return
 
     _install_project_editable(session)
-    session.install("build")
+    _cached_install(session, "build")
 
     dist_dir = ROOT / "dist"
     build_dir = ROOT / "build"
@@ -177,8 +268,9 @@ def build_exe(session: nox.Session) -> None:
     _install_project_editable(session)
     # Ensure optional dictionary backend is available for GUI builds
     # and PyInstaller/PyQt6 are present so dependencies freeze correctly.
+    # The project install is not cached so it always reflects the sources.
     session.install(".[dictionaries]")
-    session.install("pyinstaller", "PyQt6")
+    _cached_install(session, "pyinstaller", "PyQt6")
 
     dist_dir = ROOT / "dist"
     build_dir = ROOT / "build"
@@ -223,6 +315,18 @@ def publish_release(session: nox.Session) -> None:
 
 
 
+def _write_sha256(session: nox.Session, path: Path) -> Path:
+    """Write ``<path>.sha256`` by running tools/generate_sha256.py in-process.
+
+    The tool script stays the single source of the checksum format; loading
+    it here avoids starting a second interpreter.
+    """
+    tool = runpy.run_path(str(ROOT / "tools" / "generate_sha256.py"))
+    if tool["main"](["generate_sha256.py", str(path)]) != 0:
+        session.error(f"Failed to write checksum for {path}")
+    return path.with_suffix(path.suffix + ".sha256")
+
+
 @nox.session(name="bundle_release")
 def bundle_release(session: nox.Session) -> None:
     """
@@ -305,7 +409,8 @@ def bundle_release(session: nox.Session) -> None:
 
     # Generate SHA-256 checksum for the zip archive.
     session.log("Generating SHA-256 checksum for the release zip")
-    session.run("python", "tools/generate_sha256.py", str(zip_path), external=True)
+    checksum_path = _write_sha256(session, zip_path)
+    session.log(f"Wrote checksum: {checksum_path}")
 
 
 @nox.session
@@ -357,15 +462,14 @@ def prepush(session: nox.Session) -> None:
       - verify SPDX headers
       - run linting
       - run type-checking
-      - run unit tests
-      - run coverage
+      - run the unit tests under coverage
     """
-    session.log("Running pre-push checks: format → spdx → lint → typecheck → tests → coverage")
+    session.log("Running pre-push checks: format → spdx → lint → typecheck → coverage")
 
-    # These queue other sessions to be run in this Nox invocation.
+    # These queue other sessions to be run in this Nox invocation. The coverage
+    # session runs the full test suite, so "tests" is not queued separately.
     session.notify("format")
     session.notify("spdx")       # default is 'check' mode
     session.notify("lint")
     session.notify("typecheck")
-    session.notify("tests")
     session.notify("coverage")
@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: MIT
+"""Setuptools shim that stamps the project version into built packages.
+
+All project metadata lives in pyproject.toml; this file only customizes
+``build_py`` so wheels ship a ``nonwordgen/_version.py`` module and the
+installed package can report ``__version__`` without an importlib.metadata
+lookup.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+VERSION_TEMPLATE = '''\
+# SPDX-License-Identifier: MIT
+"""Version of the nonwordgen package, generated at build time."""
+
+__version__ = "{version}"
+'''
+
+
+class BuildPyWithVersion(build_py):
+    """Standard build_py that also writes nonwordgen/_version.py."""
+
+    def run(self) -> None:
+        super().run()
+        target = Path(self.build_lib) / "nonwordgen" / "_version.py"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            VERSION_TEMPLATE.format(version=self.distribution.get_version()),
+            encoding="utf-8",
+        )
+
+
+setup(cmdclass={"build_py": BuildPyWithVersion})
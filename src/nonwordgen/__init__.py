@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-from importlib import metadata
 from pathlib import Path
 
 from .config import Strictness, build_dictionary_for_strictness
@@ -50,8 +49,8 @@ def _read_version_from_pyproject() -> str | None:
         # tomllib is available in the stdlib from Python 3.11+.
         import tomllib
 
-        with pyproject_path.open("rb") as f:
-            data = tomllib.load(f)
+        # One read instead of tomllib.load()'s chunked file-object reads.
+        data = tomllib.loads(pyproject_path.read_bytes().decode("utf-8"))
         project = data.get("project") or {}
         version = project.get("version")
         if isinstance(version, str):
@@ -61,10 +60,32 @@ def _read_version_from_pyproject() -> str | None:
     return None
 
 
-try:
-    # Prefer the installed package metadata when available.
-    __version__ = metadata.version("nonwordgen")
-except metadata.PackageNotFoundError:
-    # Fallback to reading directly from pyproject.toml in a source checkout.
-    _version = _read_version_from_pyproject()
-    __version__ = _version if _version is not None else "0.0.0"
+def _resolve_version() -> str:
+    """Return the package version, preferring the build-time stamp."""
+    try:
+        # Wheels ship a _version module written by setup.py at build time.
+        from ._version import __version__ as stamped
+    except ImportError:
+        pass
+    else:
+        return stamped
+
+    # importlib.metadata walks sys.path looking for dist-info directories, so
+    # only pay for it when somebody actually asks for __version__.
+    from importlib import metadata
+
+    try:
+        return metadata.version("nonwordgen")
+    except metadata.PackageNotFoundError:
+        # Fallback to reading directly from pyproject.toml in a source checkout.
+        version = _read_version_from_pyproject()
+        return version if version is not None else "0.0.0"
+
+
+def __getattr__(name: str) -> str:
+    if name == "__version__":
+        version = _resolve_version()
+        # Store the result so later lookups bypass this hook entirely.
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,6 +16,11 @@ from .textgen import (
     generate_sentences,
 )
 
+# argparse already restricts --strictness to these values, so a plain dict
+# lookup is enough to map them back to the enum.
+_STRICTNESS_MAP = {strictness.value: strictness for strictness in Strictness}
+_STRICTNESS_CHOICES = tuple(_STRICTNESS_MAP)
+
 
 def _generator_options_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(add_help=False)
@@ -47,7 +52,7 @@ def _generator_options_parser() -> argparse.ArgumentParser:
         "--strictness",
         type=str,
         default=Strictness.MEDIUM.value,
-        choices=[value.value for value in Strictness],
+        choices=_STRICTNESS_CHOICES,
         help="Filtering strictness (loose, medium, strict, very_strict).",
     )
     parser.add_argument(
@@ -182,6 +187,23 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the process-wide parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _write_blocks(blocks: Sequence[str], terminator: str = "\n") -> None:
+    """Write each block followed by *terminator* in a single stdout call."""
+    sys.stdout.write(terminator.join(blocks) + terminator)
+    sys.stdout.flush()
+
+
 def _build_generator(args: argparse.Namespace) -> WordGenerator:
     rng = random.Random(args.seed) if args.seed is not None else None
     return WordGenerator(
@@ -189,7 +211,7 @@ def _build_generator(args: argparse.Namespace) -> WordGenerator:
         max_length=args.max_length,
         min_syllables=args.min_syllables,
         max_syllables=args.max_syllables,
-        strictness=Strictness(args.strictness),
+        strictness=_STRICTNESS_MAP[args.strictness],
         allow_real_words=args.allow_real_words,
         rng=rng,
         language=args.language,
@@ -198,7 +220,7 @@ def _build_generator(args: argparse.Namespace) -> WordGenerator:
 
 def main(argv: Sequence[str] | None = None) -> int:
     """Entry point for the console script."""
-    parser = _build_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     if args.command == "gui":
@@ -223,8 +245,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             min_words=args.min_words,
             max_words=args.max_words,
         )
-        for sentence in sentences:
-            print(sentence)
+        _write_blocks(sentences)
         return 0
 
     if args.command == "paragraphs":
@@ -236,15 +257,13 @@ def main(argv: Sequence[str] | None = None) -> int:
             min_words=args.min_words,
             max_words=args.max_words,
         )
-        for paragraph in paragraphs:
-            print(paragraph)
-            print()
+        # Paragraphs are separated (and followed) by a blank line.
+        _write_blocks(paragraphs, "\n\n")
         return 0
 
     # Default: words
     words = generator.generate_many(args.count)
-    for word in words:
-        print(word)
+    _write_blocks(words)
     return 0
 
 
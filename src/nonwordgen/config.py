@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from .dictionary_base import DictionaryBackend
 from .language_base import LanguagePlugin
-from .languages import get_language_plugin
+from .languages import _PLUGINS, get_language_plugin
 from .strictness import Strictness
 
 __all__ = [
@@ -24,6 +25,18 @@ class ConfigError(Exception):
     pass
 
 
+# One entry per built-in language and strictness at a given threshold.
+@functools.lru_cache(maxsize=len(_PLUGINS) * len(Strictness))
+def _build_dictionary_cached(
+    language: str,
+    strictness: Strictness,
+    real_word_min_zipf: float,
+) -> DictionaryBackend:
+    return get_language_plugin(language).build_dictionary(
+        strictness, real_word_min_zipf
+    )
+
+
 def build_dictionary_for_strictness(
     strictness: Strictness,
     real_word_min_zipf: float = 2.7,
@@ -31,9 +44,16 @@ def build_dictionary_for_strictness(
     language: str = "english",
     language_plugin: LanguagePlugin | None = None,
 ) -> DictionaryBackend:
-    """Build a dictionary backend using the chosen language plugin."""
-    plugin = language_plugin or get_language_plugin(language)
-    return plugin.build_dictionary(strictness, real_word_min_zipf)
+    """Build a dictionary backend using the chosen language plugin.
+
+    Dictionaries for registered languages are cached per (language,
+    strictness, threshold). They are read-only once built, so generators
+    created with the same settings share one backend instead of reloading
+    word lists. An explicit *language_plugin* is always asked directly.
+    """
+    if language_plugin is not None:
+        return language_plugin.build_dictionary(strictness, real_word_min_zipf)
+    return _build_dictionary_cached(language.lower(), strictness, real_word_min_zipf)
 
 
 def _validate_range(name: str, minimum: int, maximum: int) -> list[str]:
@@ -50,6 +70,17 @@ def _validate_range(name: str, minimum: int, maximum: int) -> list[str]:
     return errors
 
 
+# (label used in messages, minimum attribute, maximum attribute)
+_RANGES: tuple[tuple[str, str, str], ...] = (
+    ("Word length", "min_length", "max_length"),
+    ("Syllables per word", "min_syllables", "max_syllables"),
+    ("Words per sentence", "min_words", "max_words"),
+    ("Sentences per paragraph", "min_sentences", "max_sentences"),
+)
+
+_MISSING: Any = object()
+
+
 def validate_config(cfg: Any) -> None:
     """Validate a configuration object containing generator/text parameters.
 
@@ -63,24 +94,12 @@ def validate_config(cfg: Any) -> None:
 
     Only attributes that are present on *cfg* are validated.
     """
-
-    def _maybe_validate(
-        human_name: str,
-        min_attr: str,
-        max_attr: str,
-        errors: list[str],
-    ) -> None:
-        if hasattr(cfg, min_attr) and hasattr(cfg, max_attr):
-            minimum = getattr(cfg, min_attr)
-            maximum = getattr(cfg, max_attr)
-            errors.extend(_validate_range(human_name, int(minimum), int(maximum)))
-
     errors: list[str] = []
-
-    _maybe_validate("Word length", "min_length", "max_length", errors)
-    _maybe_validate("Syllables per word", "min_syllables", "max_syllables", errors)
-    _maybe_validate("Words per sentence", "min_words", "max_words", errors)
-    _maybe_validate("Sentences per paragraph", "min_sentences", "max_sentences", errors)
+    for human_name, min_attr, max_attr in _RANGES:
+        minimum = getattr(cfg, min_attr, _MISSING)
+        maximum = getattr(cfg, max_attr, _MISSING)
+        if minimum is not _MISSING and maximum is not _MISSING:
+            errors.extend(_validate_range(human_name, int(minimum), int(maximum)))
 
     if errors:
         bullet_list = "\n".join(f"- {msg}" for msg in errors)
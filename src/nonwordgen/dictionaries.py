@@ -3,63 +3,152 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Iterable, Sequence
+from typing import Any, Callable, Collection, Iterable, Sequence
 
 from .dictionary_base import DictionaryBackend
 
 logger = logging.getLogger(__name__)
 
-try:  # pragma: no cover - optional dependency
-    from wordfreq import zipf_frequency
-except Exception:  # pragma: no cover - optional dependency
-    zipf_frequency = None
+# Importing wordfreq takes longer than importing the rest of the package, and
+# LOOSE strictness never needs it, so its functions are bound on first use by
+# _resolve_wordfreq(). Names stay None when wordfreq is not installed.
+_UNRESOLVED: Any = object()
+zipf_frequency: Any = _UNRESOLVED
+freq_to_zipf: Any = _UNRESOLVED
+get_frequency_dict: Any = _UNRESOLVED
+get_language_info: Any = _UNRESOLVED
+
+
+def _resolve_wordfreq() -> None:
+    """Bind the wordfreq functions this module uses, importing it if needed."""
+    global zipf_frequency, freq_to_zipf, get_frequency_dict, get_language_info
+
+    lookup: Any
+    to_zipf: Any
+    frequency_dict: Any
+    language_info: Any
+
+    if zipf_frequency is _UNRESOLVED:
+        try:  # pragma: no cover - optional dependency
+            from wordfreq import zipf_frequency as lookup
+        except Exception:  # pragma: no cover - optional dependency
+            lookup = None
+        zipf_frequency = lookup
+
+    if get_frequency_dict is _UNRESOLVED:
+        try:  # pragma: no cover - optional dependency
+            from wordfreq import freq_to_zipf as to_zipf
+            from wordfreq import get_frequency_dict as frequency_dict
+            from wordfreq import get_language_info as language_info
+        except Exception:  # pragma: no cover - optional dependency
+            to_zipf = frequency_dict = language_info = None
+        freq_to_zipf = to_zipf
+        get_frequency_dict = frequency_dict
+        get_language_info = language_info
+
+
+# Upper bound on memoized CompositeDictionary lookups per instance.
+_LOOKUP_CACHE_SIZE = 65536
+
+# Number of wordfreq lookups after which WordfreqDictionary switches to a
+# precomputed vocabulary set. Building the set costs about as much as ~15k
+# individual zipf_frequency() calls, so short CLI runs never pay for it.
+_VOCABULARY_AFTER_LOOKUPS = 10_000
+
+
+def _load_vocabulary(
+    language: str, wordlist: str, min_zipf: float
+) -> frozenset[str] | None:
+    """Return the casefolded words wordfreq rates at or above *min_zipf*.
+
+    Returns None when wordfreq is unavailable or when its lookups for
+    *language* rely on more than casefolding (custom tokenizers, mark
+    removal, transliteration), since plain set membership would then
+    disagree with zipf_frequency().
+    """
+    _resolve_wordfreq()
+    if get_frequency_dict is None:
+        return None
+    try:
+        info = get_language_info(language)
+        if (
+            info["tokenizer"] != "regex"
+            or info["normal_form"] != "NFC"
+            or info["remove_marks"]
+            or info["dotless_i"]
+            or info["diacritics_under"]
+            or info["transliteration"]
+        ):
+            return None
+        frequencies = get_frequency_dict(language, wordlist)
+    except Exception:
+        logger.debug("Could not precompute wordfreq vocabulary for %r.", language)
+        return None
+    # freq_to_zipf is monotonic and wordfreq stores only a few hundred distinct
+    # (bucketed) frequencies, so convert each distinct value once and keep the
+    # words at or above the lowest passing frequency.
+    passing = [
+        freq for freq in set(frequencies.values()) if freq_to_zipf(freq) >= min_zipf
+    ]
+    if not passing:
+        return frozenset()
+    cutoff = min(passing)
+    return frozenset(word for word, freq in frequencies.items() if freq >= cutoff)
 
 
 class BuiltinCommonWordsDictionary(DictionaryBackend):
     """Very small fallback dictionary containing ultra-common English words."""
 
-    _COMMON_WORDS = {
-        "about",
-        "after",
-        "again",
-        "always",
-        "because",
-        "before",
-        "could",
-        "first",
-        "from",
-        "have",
-        "house",
-        "never",
-        "other",
-        "people",
-        "should",
-        "small",
-        "their",
-        "there",
-        "these",
-        "thing",
-        "think",
-        "those",
-        "time",
-        "under",
-        "water",
-        "where",
-        "which",
-        "with",
-        "world",
-        "would",
-        "your",
-        "the",
-        "and",
-        "that",
-        "this",
-        "what",
-    }
+    __slots__ = ()
+
+    COST = 0
+
+    _COMMON_WORDS = frozenset(
+        {
+            "about",
+            "after",
+            "again",
+            "always",
+            "because",
+            "before",
+            "could",
+            "first",
+            "from",
+            "have",
+            "house",
+            "never",
+            "other",
+            "people",
+            "should",
+            "small",
+            "their",
+            "there",
+            "these",
+            "thing",
+            "think",
+            "those",
+            "time",
+            "under",
+            "water",
+            "where",
+            "which",
+            "with",
+            "world",
+            "would",
+            "your",
+            "the",
+            "and",
+            "that",
+            "this",
+            "what",
+        }
+    )
 
     def is_real_word(self, word: str) -> bool:
-        return word.lower() in self._COMMON_WORDS
+        # Generated candidates are already lowercase; skip the copy for them.
+        return (word if word.islower() else word.lower()) in self._COMMON_WORDS
 
 
 class WordfreqDictionary(DictionaryBackend):
@@ -69,14 +158,34 @@ class WordfreqDictionary(DictionaryBackend):
 
     If the language is not supported by wordfreq (e.g. Thai / 'th'), this
     backend automatically disables itself instead of raising.
+
+    Once a backend has served many lookups it loads wordfreq's vocabulary
+    above the threshold into a set, after which each query is a single
+    membership test instead of a tokenize-and-lookup round trip. Pass
+    ``preload=True`` to build that set up front, e.g. in long-running
+    processes that will generate large batches.
     """
 
+    __slots__ = (
+        "language",
+        "min_zipf",
+        "wordlist",
+        "available",
+        "_enabled",
+        "_lookups",
+        "_vocabulary",
+    )
+
+    COST = 2
+
     def __init__(
         self,
         language: str = "en",
         min_zipf: float = 3.0,
         wordlist: str = "best",
         real_word_min_zipf: float | None = None,
+        *,
+        preload: bool = False,
     ) -> None:
         # Allow both the original ``min_zipf`` name and the newer
         # ``real_word_min_zipf`` keyword used by language plugins.
@@ -88,11 +197,14 @@ class WordfreqDictionary(DictionaryBackend):
         self.min_zipf = effective_min_zipf
         self.wordlist = wordlist
         self._enabled = True
+        self._lookups = 0
+        self._vocabulary: frozenset[str] | None = None
         # Expose an ``available`` flag so callers can cheaply test whether the
         # backend is usable, matching existing call sites that use getattr().
         self.available = False
 
         # If wordfreq is not installed, disable this backend immediately.
+        _resolve_wordfreq()
         if zipf_frequency is None:  # pragma: no cover - optional dependency
             logger.warning(
                 "wordfreq is not installed; disabling WordfreqDictionary backend."
@@ -127,6 +239,10 @@ class WordfreqDictionary(DictionaryBackend):
             self._enabled = False
         else:
             self.available = True
+            if preload:
+                self._vocabulary = _load_vocabulary(
+                    language, wordlist, effective_min_zipf
+                )
 
     def is_real_word(self, word: str) -> bool:
         """
@@ -139,6 +255,19 @@ class WordfreqDictionary(DictionaryBackend):
             # If we know this backend is unusable, don't even try.
             return False
 
+        vocabulary = self._vocabulary
+        if vocabulary is not None:
+            # wordfreq stores casefolded forms (e.g. German "ß" -> "ss").
+            return word.casefold() in vocabulary
+
+        self._lookups += 1
+        if self._lookups == _VOCABULARY_AFTER_LOOKUPS:
+            # Attempted exactly once; languages that cannot use a plain set
+            # stay on the per-call path.
+            self._vocabulary = _load_vocabulary(
+                self.language, self.wordlist, self.min_zipf
+            )
+
         try:
             try:
                 score = zipf_frequency(word, self.language, wordlist=self.wordlist)
@@ -168,33 +297,99 @@ class WordfreqDictionary(DictionaryBackend):
         return score >= self.min_zipf
 
 
+@functools.lru_cache(maxsize=64)
+def get_wordfreq_dictionary(
+    language: str, real_word_min_zipf: float
+) -> WordfreqDictionary:
+    """Return the process-wide WordfreqDictionary for a language and threshold.
+
+    Plugins build their dictionaries through this so that every strictness
+    and generator using the same settings shares one probe and one lazily
+    loaded vocabulary.
+    """
+    return WordfreqDictionary(language=language, real_word_min_zipf=real_word_min_zipf)
+
+
+def _unrolled_any(backends: Sequence[DictionaryBackend]) -> Callable[[str], bool]:
+    """Return an OR over *backends*, hand-unrolled for the common small sizes."""
+    checks = [backend.is_real_word for backend in backends]
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda word: first(word) or second(word)
+    if len(checks) == 3:
+        first, second, third = checks
+        return lambda word: first(word) or second(word) or third(word)
+
+    def check_all(word: str) -> bool:
+        for check in checks:
+            if check(word):
+                return True
+        return False
+
+    return check_all
+
+
 class CompositeDictionary(DictionaryBackend):
-    """Combine multiple dictionary backends with logical OR semantics."""
+    """Combine multiple dictionary backends with logical OR semantics.
+
+    Backends are queried cheapest-first (by ``COST``). The backend chain is
+    fixed at construction time and exposed as a tuple. Most queries are
+    non-words that every backend must reject, so ordering by hit rate would
+    not save lookups; ordering by cost does.
 
-    def __init__(self, backends: Iterable[DictionaryBackend]) -> None:
-        self.backends = list(backends)
+    Pass ``memoize=True`` only when every backend always gives the same
+    answer for a word; results are then cached, since the generator's retry
+    loop tends to revisit the same candidates.
+    """
+
+    __slots__ = ("backends", "_lookup")
+
+    def __init__(
+        self, backends: Iterable[DictionaryBackend], *, memoize: bool = False
+    ) -> None:
+        self.backends = tuple(
+            sorted(backends, key=lambda backend: getattr(backend, "COST", 1))
+        )
         if not self.backends:
             raise ValueError("CompositeDictionary requires at least one backend.")
+        lookup = _unrolled_any(self.backends)
+        if memoize:
+            lookup = functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)(lookup)
+        self._lookup = lookup
 
     def is_real_word(self, word: str) -> bool:
-        return any(backend.is_real_word(word) for backend in self.backends)
+        # Normalize once here so each backend can do a bare membership test.
+        return self._lookup(word.lower())
 
 
 class StaticWordSetDictionary(DictionaryBackend):
     """Simple dictionary that uses a provided set of words."""
 
-    def __init__(self, words: Sequence[str]) -> None:
+    __slots__ = ("_words",)
+
+    COST = 0
+
+    def __init__(self, words: Collection[str]) -> None:
         if not words:
             raise ValueError("StaticWordSetDictionary requires at least one word.")
-        self._words = {word.lower() for word in words}
+        if isinstance(words, frozenset) and all(word == word.lower() for word in words):
+            # Already normalized and immutable; share it instead of copying.
+            self._words = words
+        else:
+            # Let the frozenset constructor drain a C-level map instead of a
+            # Python generator frame.
+            self._words = frozenset(map(str.lower, words))
 
     def is_real_word(self, word: str) -> bool:
-        return word.lower() in self._words
+        return (word if word.islower() else word.lower()) in self._words
 
 
 __all__ = [
     "BuiltinCommonWordsDictionary",
     "WordfreqDictionary",
+    "get_wordfreq_dictionary",
     "CompositeDictionary",
     "StaticWordSetDictionary",
 ]
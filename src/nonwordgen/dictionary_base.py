@@ -9,6 +9,11 @@ import abc
 class DictionaryBackend(abc.ABC):
     """Interface that decides whether a generated word already exists."""
 
+    __slots__ = ()
+
+    # Relative lookup cost; CompositeDictionary queries cheaper backends first.
+    COST: int = 1
+
     @abc.abstractmethod
     def is_real_word(self, word: str) -> bool:
-        """Return True if *word* should be treated as a real English word."""
+        """Return True if *word* should be treated as a real word."""
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from .config import Strictness, build_dictionary_for_strictness
 from .dictionary_base import DictionaryBackend
@@ -15,6 +15,8 @@ from .languages import get_language_plugin
 class WordGenerator:
     """Generate English-like non-words while filtering real ones."""
 
+    _BATCH_SIZE = 256
+
     def __init__(
         self,
         min_length: int = 4,
@@ -45,32 +47,70 @@ class WordGenerator:
         self.strictness = strictness
         self.allow_real_words = allow_real_words
         self._language_plugin = language_plugin or get_language_plugin(language)
-        self._dictionary = dictionary or build_dictionary_for_strictness(
-            strictness, language_plugin=self._language_plugin
+        self.dictionary = dictionary or build_dictionary_for_strictness(
+            strictness, language=language, language_plugin=language_plugin
         )
         self._rng = rng or random.Random()
-        self._banned_words = (
-            {word.lower() for word in banned_words} if banned_words else set()
+        self.banned_words = banned_words
+
+    @property
+    def dictionary(self) -> DictionaryBackend:
+        """The backend used to reject real words."""
+        return self._dictionary
+
+    @dictionary.setter
+    def dictionary(self, dictionary: DictionaryBackend) -> None:
+        self._dictionary = dictionary
+        self._is_real = dictionary.is_real_word
+
+    @property
+    def banned_words(self) -> frozenset[str]:
+        """Lowercased words the generator will never emit."""
+        return self._banned_words
+
+    @banned_words.setter
+    def banned_words(self, banned_words: Optional[Iterable[str]]) -> None:
+        self._banned_words = frozenset(word.lower() for word in banned_words or ())
+        # With nothing banned the hot loops skip the membership test entirely.
+        self._is_banned: Callable[[str], bool] | None = (
+            self._banned_words.__contains__ if self._banned_words else None
         )
 
+    def _syllable_floor(self) -> int:
+        """Return the fewest syllables that can still reach ``min_length``.
+
+        Syllable counts below this always yield rejected candidates, so they
+        are skipped without changing which words can be produced.
+        """
+        longest = self._language_plugin.max_syllable_length
+        if not longest:
+            return self.min_syllables
+        needed = -(-self.min_length // longest)
+        return min(max(self.min_syllables, needed), self.max_syllables)
+
     def generate_one(self, max_attempts: int = 1000) -> str:
         """Generate a single non-word, raising if the attempt budget is exhausted."""
         if max_attempts < 1:
             raise ValueError("max_attempts must be at least 1.")
 
+        build = self._language_plugin.build_candidate
+        rng = self._rng
+        min_syllables = self._syllable_floor()
+        max_syllables = self.max_syllables
+        min_length = self.min_length
+        max_length = self.max_length
+        is_banned = self._is_banned
+        is_real = self._is_real
+        allow_real_words = self.allow_real_words
+
         for _ in range(max_attempts):
-            candidate = self._language_plugin.build_candidate(
-                self._rng,
-                self.min_syllables,
-                self.max_syllables,
-                self.max_length,
-            )
-
-            if len(candidate) < self.min_length or len(candidate) > self.max_length:
+            candidate = build(rng, min_syllables, max_syllables, max_length)
+
+            if len(candidate) < min_length or len(candidate) > max_length:
                 continue
-            if candidate in self._banned_words:
+            if is_banned is not None and is_banned(candidate):
                 continue
-            if not self.allow_real_words and self._dictionary.is_real_word(candidate):
+            if not allow_real_words and is_real(candidate):
                 continue
             return candidate
 
@@ -79,20 +119,70 @@ class WordGenerator:
             f"after {max_attempts} attempts."
         )
 
-    def generate_many(self, count: int, unique: bool = True) -> list[str]:
-        """Generate *count* words; optionally ensure they are unique."""
+    def _generate_batch(self, n: int) -> list[str]:
+        """Build *n* candidates and return the ones passing every filter, in order."""
+        min_length = self.min_length
+        max_length = self.max_length
+        is_banned = self._is_banned
+        is_real = self._is_real
+        allow_real_words = self.allow_real_words
+
+        candidates = self._language_plugin.build_candidates(
+            self._rng, n, self._syllable_floor(), self.max_syllables, max_length
+        )
+        return [
+            candidate
+            for candidate in candidates
+            if min_length <= len(candidate) <= max_length
+            and (is_banned is None or not is_banned(candidate))
+            and (allow_real_words or not is_real(candidate))
+        ]
+
+    def generate_iter(
+        self, count: int, unique: bool = True, max_attempts: int = 1000
+    ) -> Iterator[str]:
+        """Yield *count* words; optionally ensure they are unique.
+
+        Candidates are built in batches of at most the number still needed, so
+        a seeded RNG yields the same words as repeated :meth:`generate_one`
+        calls. *max_attempts* bounds consecutive rejected candidates,
+        counting repeats as rejections when *unique* is set. Only one batch
+        (and the set of words seen, if *unique*) is held at a time.
+        """
         if count < 1:
             raise ValueError("count must be at least 1.")
+        return self._iter_words(count, unique, max_attempts)
 
-        results: list[str] = []
+    def _iter_words(self, count: int, unique: bool, max_attempts: int) -> Iterator[str]:
         seen: set[str] | None = set() if unique else None
+        remaining = count
+        misses = 0
 
-        while len(results) < count:
-            word = self.generate_one()
+        while remaining:
+            size = min(remaining, self._BATCH_SIZE)
+            batch = self._generate_batch(size)
             if seen is not None:
-                if word in seen:
-                    continue
-                seen.add(word)
-            results.append(word)
+                fresh: list[str] = []
+                for word in batch:
+                    if word not in seen:
+                        seen.add(word)
+                        fresh.append(word)
+                batch = fresh
+            if not batch:
+                # Filtered and duplicate candidates both count as misses.
+                misses += size
+                if misses >= max_attempts:
+                    raise RuntimeError(
+                        "Unable to generate a non-word that satisfies the "
+                        f"constraints after {misses} attempts."
+                    )
+                continue
+            misses = 0
+            remaining -= len(batch)
+            yield from batch
 
-        return results
+    def generate_many(
+        self, count: int, unique: bool = True, max_attempts: int = 1000
+    ) -> list[str]:
+        """Generate *count* words as a list; see :meth:`generate_iter`."""
+        return list(self.generate_iter(count, unique, max_attempts))
@@ -4,16 +4,37 @@
 from __future__ import annotations
 
 import abc
+import logging
 import random
+from typing import Any, ClassVar, Collection
 
+from .dictionaries import (
+    BuiltinCommonWordsDictionary,
+    CompositeDictionary,
+    StaticWordSetDictionary,
+    get_wordfreq_dictionary,
+)
 from .dictionary_base import DictionaryBackend
+from .phonotactics import (
+    PhonoProfile,
+    build_candidate_from_profile,
+    build_candidates_from_profile,
+)
 from .strictness import Strictness
 
+# Strictness levels that consult the wordfreq backend on top of common words.
+_MEDIUM_OR_STRONGER = frozenset(
+    {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}
+)
+
 
 class LanguagePlugin(abc.ABC):
     """A plugin provides phonotactics and dictionaries for a language."""
 
     name: str
+    # Upper bound on characters per syllable, if known. The generator uses it
+    # to skip syllable counts that could never reach min_length.
+    max_syllable_length: int | None = None
 
     @abc.abstractmethod
     def build_candidate(
@@ -25,6 +46,20 @@ class LanguagePlugin(abc.ABC):
     ) -> str:
         """Return a candidate non-word obeying syllable and length limits."""
 
+    def build_candidates(
+        self,
+        rng: random.Random,
+        count: int,
+        min_syllables: int,
+        max_syllables: int,
+        max_length: int,
+    ) -> list[str]:
+        """Return *count* candidates; override to amortize per-call setup."""
+        build = self.build_candidate
+        return [
+            build(rng, min_syllables, max_syllables, max_length) for _ in range(count)
+        ]
+
     @abc.abstractmethod
     def build_dictionary(
         self,
@@ -32,3 +67,128 @@ class LanguagePlugin(abc.ABC):
         real_word_min_zipf: float = 2.7,
     ) -> DictionaryBackend:
         """Construct the dictionary backend chain for the language."""
+
+    @classmethod
+    def build_standard_dictionary(
+        cls,
+        common_words: Collection[str] | DictionaryBackend,
+        wordfreq_language: str,
+        strictness: Strictness,
+        real_word_min_zipf: float,
+        display_name: str,
+    ) -> DictionaryBackend:
+        """Combine a common-word list with wordfreq for MEDIUM and stricter.
+
+        VERY_STRICT caps the zipf threshold at 2.0 so rarer words are rejected
+        too. If wordfreq cannot serve *wordfreq_language*, the common words are
+        used alone and a warning is logged under the plugin's module.
+        """
+        backends: list[DictionaryBackend] = [
+            (
+                common_words
+                if isinstance(common_words, DictionaryBackend)
+                else StaticWordSetDictionary(common_words)
+            )
+        ]
+
+        if strictness in _MEDIUM_OR_STRONGER:
+            threshold = real_word_min_zipf
+            if strictness == Strictness.VERY_STRICT:
+                threshold = min(real_word_min_zipf, 2.0)
+            wordfreq_backend = get_wordfreq_dictionary(wordfreq_language, threshold)
+            if getattr(wordfreq_backend, "available", False):
+                backends.append(wordfreq_backend)
+            else:
+                logger = logging.getLogger(cls.__module__)
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "wordfreq backend unavailable for %s; "
+                        "%s strictness is degraded.",
+                        display_name,
+                        strictness.value,
+                    )
+
+        if len(backends) == 1:
+            return backends[0]
+        # Built-in word sets and wordfreq never change their answers, so the
+        # chain can be memoized; a caller-supplied backend might.
+        return CompositeDictionary(
+            backends,
+            memoize=isinstance(
+                backends[0], (StaticWordSetDictionary, BuiltinCommonWordsDictionary)
+            ),
+        )
+
+
+class PhonotacticLanguagePlugin(LanguagePlugin):
+    """A plugin described entirely by data.
+
+    Subclasses set ``name``, a syllable ``profile``, the ``common_words`` to
+    reject outright, the ``wordfreq_language`` code and a ``display_name``
+    for log messages; candidate building and dictionary construction are
+    shared.
+    """
+
+    profile: ClassVar[PhonoProfile]
+    common_words: ClassVar[Collection[str] | DictionaryBackend]
+    wordfreq_language: ClassVar[str]
+    display_name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        profile = cls.__dict__.get("profile")
+        if profile is not None:
+            cls.max_syllable_length = profile.longest_syllable
+
+    def build_candidate(
+        self,
+        rng: random.Random,
+        min_syllables: int,
+        max_syllables: int,
+        max_length: int,
+    ) -> str:
+        profile = self.profile
+        return build_candidate_from_profile(
+            rng,
+            min_syllables,
+            max_syllables,
+            max_length,
+            profile.onsets,
+            profile.nuclei,
+            profile.codas,
+            lowercase=profile.lowercase,
+        )
+
+    def build_candidates(
+        self,
+        rng: random.Random,
+        count: int,
+        min_syllables: int,
+        max_syllables: int,
+        max_length: int,
+    ) -> list[str]:
+        profile = self.profile
+        return build_candidates_from_profile(
+            rng,
+            count,
+            min_syllables,
+            max_syllables,
+            max_length,
+            profile.onsets,
+            profile.nuclei,
+            profile.codas,
+            lowercase=profile.lowercase,
+        )
+
+    def build_dictionary(
+        self,
+        strictness: Strictness,
+        real_word_min_zipf: float = 2.7,
+    ) -> DictionaryBackend:
+        return self.build_standard_dictionary(
+            self.common_words,
+            self.wordfreq_language,
+            strictness,
+            real_word_min_zipf,
+            self.display_name,
+        )
@@ -1,40 +1,51 @@
 # SPDX-License-Identifier: MIT
-"""Language plugin registry and helpers."""
+"""Language plugin registry and helpers.
+
+Built-in plugins are imported on first use so that a process generating
+one language does not load the phonotactic tables of all the others.
+"""
 
 from __future__ import annotations
 
+import importlib
 from typing import Dict
 
 from ..language_base import LanguagePlugin
-from .afrikaans import AfrikaansLanguagePlugin
-from .czech import CzechLanguagePlugin
-from .danish import DanishLanguagePlugin
-from .dutch import DutchLanguagePlugin
-from .english import EnglishLanguagePlugin
-from .french import FrenchLanguagePlugin
-from .german import GermanLanguagePlugin
-from .greek import GreekLanguagePlugin
-from .hebrew import HebrewLanguagePlugin
-from .hindi import HindiLanguagePlugin
-from .hungarian import HungarianLanguagePlugin
-from .indonesian import IndonesianLanguagePlugin
-from .italian import ItalianLanguagePlugin
-from .korean import KoreanLanguagePlugin
-from .malay import MalayLanguagePlugin
-from .norwegian import NorwegianLanguagePlugin
-from .polish import PolishLanguagePlugin
-from .portuguese import PortugueseLanguagePlugin
-from .romanian import RomanianLanguagePlugin
-from .russian import RussianLanguagePlugin
-from .scb import SCBLanguagePlugin
-from .spanish import SpanishLanguagePlugin
-from .swahili import SwahiliLanguagePlugin
-from .swedish import SwedishLanguagePlugin
-from .tagalog import TagalogLanguagePlugin
-from .thai import ThaiLanguagePlugin
-from .turkish import TurkishLanguagePlugin
-from .vietnamese import VietnameseLanguagePlugin
-from .yoruba import YorubaLanguagePlugin
+
+# Built-in plugins as "module.Class"; the module name is the language name.
+_PLUGINS: tuple[str, ...] = (
+    "afrikaans.AfrikaansLanguagePlugin",
+    "czech.CzechLanguagePlugin",
+    "danish.DanishLanguagePlugin",
+    "dutch.DutchLanguagePlugin",
+    "english.EnglishLanguagePlugin",
+    "french.FrenchLanguagePlugin",
+    "german.GermanLanguagePlugin",
+    "greek.GreekLanguagePlugin",
+    "hebrew.HebrewLanguagePlugin",
+    "hindi.HindiLanguagePlugin",
+    "hungarian.HungarianLanguagePlugin",
+    "indonesian.IndonesianLanguagePlugin",
+    "italian.ItalianLanguagePlugin",
+    "korean.KoreanLanguagePlugin",
+    "malay.MalayLanguagePlugin",
+    "norwegian.NorwegianLanguagePlugin",
+    "polish.PolishLanguagePlugin",
+    "portuguese.PortugueseLanguagePlugin",
+    "romanian.RomanianLanguagePlugin",
+    "russian.RussianLanguagePlugin",
+    "scb.SCBLanguagePlugin",
+    "spanish.SpanishLanguagePlugin",
+    "swahili.SwahiliLanguagePlugin",
+    "swedish.SwedishLanguagePlugin",
+    "tagalog.TagalogLanguagePlugin",
+    "thai.ThaiLanguagePlugin",
+    "turkish.TurkishLanguagePlugin",
+    "vietnamese.VietnameseLanguagePlugin",
+    "yoruba.YorubaLanguagePlugin",
+)
+
+_PLUGIN_MODULES: Dict[str, str] = dict(entry.split(".", 1) for entry in _PLUGINS)
 
 _REGISTERED_PLUGINS: Dict[str, LanguagePlugin] = {}
 
@@ -44,50 +55,29 @@ def register_language(plugin: LanguagePlugin) -> None:
     _REGISTERED_PLUGINS[plugin.name.lower()] = plugin
 
 
-register_language(EnglishLanguagePlugin())
-register_language(FrenchLanguagePlugin())
-register_language(GermanLanguagePlugin())
-register_language(HindiLanguagePlugin())
-register_language(IndonesianLanguagePlugin())
-register_language(ItalianLanguagePlugin())
-register_language(TagalogLanguagePlugin())
-register_language(KoreanLanguagePlugin())
-register_language(PortugueseLanguagePlugin())
-register_language(SpanishLanguagePlugin())
-register_language(SwahiliLanguagePlugin())
-register_language(TurkishLanguagePlugin())
-register_language(RussianLanguagePlugin())
-register_language(VietnameseLanguagePlugin())
-register_language(DutchLanguagePlugin())
-register_language(RomanianLanguagePlugin())
-register_language(SwedishLanguagePlugin())
-register_language(NorwegianLanguagePlugin())
-register_language(DanishLanguagePlugin())
-register_language(AfrikaansLanguagePlugin())
-register_language(YorubaLanguagePlugin())
-register_language(PolishLanguagePlugin())
-register_language(CzechLanguagePlugin())
-register_language(HungarianLanguagePlugin())
-register_language(GreekLanguagePlugin())
-register_language(ThaiLanguagePlugin())
-register_language(HebrewLanguagePlugin())
-register_language(SCBLanguagePlugin())
-register_language(MalayLanguagePlugin())
+def _load_builtin(key: str) -> LanguagePlugin:
+    module = importlib.import_module(f".{key}", __name__)
+    plugin: LanguagePlugin = getattr(module, _PLUGIN_MODULES[key])()
+    register_language(plugin)
+    return plugin
 
 
 def available_languages() -> list[str]:
     """Return the list of registered language identifiers."""
-    return sorted(_REGISTERED_PLUGINS)
+    return sorted(_PLUGIN_MODULES.keys() | _REGISTERED_PLUGINS.keys())
 
 
 def get_language_plugin(name: str | None = None) -> LanguagePlugin:
     """Retrieve a language plugin by name, defaulting to English."""
     key = (name or "english").lower()
-    if key not in _REGISTERED_PLUGINS:
+    plugin = _REGISTERED_PLUGINS.get(key)
+    if plugin is not None:
+        return plugin
+    if key not in _PLUGIN_MODULES:
         raise ValueError(
             f"Unknown language '{name}'. Available languages: {', '.join(available_languages())}."
         )
-    return _REGISTERED_PLUGINS[key]
+    return _load_builtin(key)
 
 
 __all__ = ["available_languages", "get_language_plugin", "register_language"]
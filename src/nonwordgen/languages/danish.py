@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-DANISH_ONSETS = [
+DANISH_ONSETS = (
     "",
     "b",
     "bl",
@@ -56,9 +44,9 @@ DANISH_ONSETS = [
     "t",
     "tr",
     "v",
-]
+)
 
-DANISH_NUCLEI = [
+DANISH_NUCLEI = (
     "a",
     "e",
     "i",
@@ -77,9 +65,9 @@ DANISH_NUCLEI = [
     "oi",
     "ua",
     "ue",
-]
+)
 
-DANISH_CODAS = [
+DANISH_CODAS = (
     "",
     "l",
     "n",
@@ -98,94 +86,57 @@ DANISH_CODAS = [
     "rs",
     "rt",
     "rm",
-]
+)
 
-COMMON_DANISH_WORDS = [
-    "hej",
-    "tak",
-    "venligst",
-    "hus",
-    "hund",
-    "kat",
-    "kvinde",
-    "mand",
-    "vand",
-    "ild",
-    "luft",
-    "jord",
-    "ven",
-    "veninde",
-    "nat",
-    "dag",
-    "tid",
-    "arbejde",
-    "verden",
-    "familie",
-    "kærlighed",
-    "liv",
-    "mor",
-    "far",
-    "bror",
-    "søster",
-    "meget",
-    "lidt",
-    "ja",
-    "nej",
-    "en",
-    "to",
-    "tre",
-]
+DANISH_PROFILE = PhonoProfile.build(DANISH_ONSETS, DANISH_NUCLEI, DANISH_CODAS)
+
+COMMON_DANISH_WORDS = frozenset(
+    {
+        "hej",
+        "tak",
+        "venligst",
+        "hus",
+        "hund",
+        "kat",
+        "kvinde",
+        "mand",
+        "vand",
+        "ild",
+        "luft",
+        "jord",
+        "ven",
+        "veninde",
+        "nat",
+        "dag",
+        "tid",
+        "arbejde",
+        "verden",
+        "familie",
+        "kærlighed",
+        "liv",
+        "mor",
+        "far",
+        "bror",
+        "søster",
+        "meget",
+        "lidt",
+        "ja",
+        "nej",
+        "en",
+        "to",
+        "tre",
+    }
+)
 
 
-class DanishLanguagePlugin(LanguagePlugin):
+class DanishLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Danish-flavored generator."""
 
     name = "danish"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            DANISH_ONSETS,
-            DANISH_NUCLEI,
-            DANISH_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_DANISH_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="da"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Danish; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = DANISH_PROFILE
+    common_words = COMMON_DANISH_WORDS
+    wordfreq_language = "da"
+    display_name = "Danish"
 
 
 __all__ = ["DanishLanguagePlugin"]
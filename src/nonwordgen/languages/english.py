@@ -3,59 +3,21 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..dictionaries import BuiltinCommonWordsDictionary
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import CODAS, NUCLEI, ONSETS, PhonoProfile
 
-from ..dictionaries import (
-    BuiltinCommonWordsDictionary,
-    CompositeDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate as english_build_candidate
-from ..strictness import Strictness
+ENGLISH_PROFILE = PhonoProfile.build(ONSETS, NUCLEI, CODAS)
 
-logger = logging.getLogger(__name__)
 
-
-class EnglishLanguagePlugin(LanguagePlugin):
+class EnglishLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin that replicates the previous English-only behavior."""
 
     name = "english"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return english_build_candidate(rng, min_syllables, max_syllables, max_length)
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [BuiltinCommonWordsDictionary()]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(real_word_min_zipf=threshold)
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = ENGLISH_PROFILE
+    common_words = BuiltinCommonWordsDictionary()
+    wordfreq_language = "en"
+    display_name = "English"
 
 
 __all__ = ["EnglishLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-FRENCH_ONSETS = [
+FRENCH_ONSETS = (
     "",
     "b",
     "br",
@@ -51,9 +39,9 @@ FRENCH_ONSETS = [
     "tr",
     "v",
     "vr",
-]
+)
 
-FRENCH_NUCLEI = [
+FRENCH_NUCLEI = (
     "a",
     "e",
     "i",
@@ -85,9 +73,9 @@ FRENCH_NUCLEI = [
     "oi",
     "ou",
     "ue",
-]
+)
 
-FRENCH_CODAS = [
+FRENCH_CODAS = (
     "",
     "l",
     "n",
@@ -105,92 +93,55 @@ FRENCH_CODAS = [
     "que",
     "che",
     "çon",
-]
+)
 
-COMMON_FRENCH_WORDS = [
-    "bonjour",
-    "merci",
-    "pardon",
-    "maison",
-    "fromage",
-    "vin",
-    "pain",
-    "eau",
-    "ami",
-    "amie",
-    "femme",
-    "homme",
-    "jour",
-    "nuit",
-    "temps",
-    "travail",
-    "monde",
-    "famille",
-    "amour",
-    "vie",
-    "mère",
-    "père",
-    "frère",
-    "sœur",
-    "beaucoup",
-    "peu",
-    "oui",
-    "non",
-    "un",
-    "deux",
-    "trois",
-]
+FRENCH_PROFILE = PhonoProfile.build(FRENCH_ONSETS, FRENCH_NUCLEI, FRENCH_CODAS)
+
+COMMON_FRENCH_WORDS = frozenset(
+    {
+        "bonjour",
+        "merci",
+        "pardon",
+        "maison",
+        "fromage",
+        "vin",
+        "pain",
+        "eau",
+        "ami",
+        "amie",
+        "femme",
+        "homme",
+        "jour",
+        "nuit",
+        "temps",
+        "travail",
+        "monde",
+        "famille",
+        "amour",
+        "vie",
+        "mère",
+        "père",
+        "frère",
+        "sœur",
+        "beaucoup",
+        "peu",
+        "oui",
+        "non",
+        "un",
+        "deux",
+        "trois",
+    }
+)
 
 
-class FrenchLanguagePlugin(LanguagePlugin):
+class FrenchLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a French-flavored generator."""
 
     name = "french"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            FRENCH_ONSETS,
-            FRENCH_NUCLEI,
-            FRENCH_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_FRENCH_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="fr"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for French; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = FRENCH_PROFILE
+    common_words = COMMON_FRENCH_WORDS
+    wordfreq_language = "fr"
+    display_name = "French"
 
 
 __all__ = ["FrenchLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-GERMAN_ONSETS = [
+GERMAN_ONSETS = (
     "",
     "b",
     "bl",
@@ -55,9 +43,9 @@ GERMAN_ONSETS = [
     "tr",
     "w",
     "z",
-]
+)
 
-GERMAN_NUCLEI = [
+GERMAN_NUCLEI = (
     "a",
     "e",
     "i",
@@ -71,9 +59,9 @@ GERMAN_NUCLEI = [
     "au",
     "eu",
     "äu",
-]
+)
 
-GERMAN_CODAS = [
+GERMAN_CODAS = (
     "",
     "b",
     "d",
@@ -96,97 +84,60 @@ GERMAN_CODAS = [
     "rst",
     "rt",
     "ß",
-]
+)
 
-COMMON_GERMAN_WORDS = [
-    "hallo",
-    "danke",
-    "bitte",
-    "haus",
-    "hund",
-    "katze",
-    "frau",
-    "mann",
-    "wasser",
-    "feuer",
-    "luft",
-    "erde",
-    "freund",
-    "freundin",
-    "tag",
-    "nacht",
-    "zeit",
-    "arbeit",
-    "welt",
-    "familie",
-    "liebe",
-    "leben",
-    "mutter",
-    "vater",
-    "bruder",
-    "schwester",
-    "viel",
-    "wenig",
-    "ja",
-    "nein",
-    "eins",
-    "zwei",
-    "drei",
-    "mädchen",
-    "groß",
-    "früh",
-]
+GERMAN_PROFILE = PhonoProfile.build(GERMAN_ONSETS, GERMAN_NUCLEI, GERMAN_CODAS)
+
+COMMON_GERMAN_WORDS = frozenset(
+    {
+        "hallo",
+        "danke",
+        "bitte",
+        "haus",
+        "hund",
+        "katze",
+        "frau",
+        "mann",
+        "wasser",
+        "feuer",
+        "luft",
+        "erde",
+        "freund",
+        "freundin",
+        "tag",
+        "nacht",
+        "zeit",
+        "arbeit",
+        "welt",
+        "familie",
+        "liebe",
+        "leben",
+        "mutter",
+        "vater",
+        "bruder",
+        "schwester",
+        "viel",
+        "wenig",
+        "ja",
+        "nein",
+        "eins",
+        "zwei",
+        "drei",
+        "mädchen",
+        "groß",
+        "früh",
+    }
+)
 
 
-class GermanLanguagePlugin(LanguagePlugin):
+class GermanLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a German-flavored generator."""
 
     name = "german"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            GERMAN_ONSETS,
-            GERMAN_NUCLEI,
-            GERMAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_GERMAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="de"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for German; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = GERMAN_PROFILE
+    common_words = COMMON_GERMAN_WORDS
+    wordfreq_language = "de"
+    display_name = "German"
 
 
 __all__ = ["GermanLanguagePlugin"]
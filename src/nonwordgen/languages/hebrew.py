@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-HEBREW_ONSETS = [
+HEBREW_ONSETS = (
     "",
     "א",
     "ב",
@@ -49,9 +37,9 @@ HEBREW_ONSETS = [
     "דר",
     "שפ",
     "שר",
-]
+)
 
-HEBREW_NUCLEI = [
+HEBREW_NUCLEI = (
     "א",
     "ה",
     "ו",
@@ -66,9 +54,9 @@ HEBREW_NUCLEI = [
     "ִ",
     "ֹ",
     "ֻ",
-]
+)
 
-HEBREW_CODAS = [
+HEBREW_CODAS = (
     "",
     "ב",
     "ג",
@@ -85,94 +73,57 @@ HEBREW_CODAS = [
     "ר",
     "ש",
     "ת",
-]
+)
 
-COMMON_HEBREW_WORDS = [
-    "שלום",
-    "תודה",
-    "בבקשה",
-    "בית",
-    "כלב",
-    "חתול",
-    "אישה",
-    "גבר",
-    "מים",
-    "אש",
-    "אוויר",
-    "אדמה",
-    "חבר",
-    "חברה",
-    "לילה",
-    "יום",
-    "זמן",
-    "עבודה",
-    "עולם",
-    "משפחה",
-    "אהבה",
-    "חיים",
-    "אמא",
-    "אבא",
-    "אח",
-    "אחות",
-    "הרבה",
-    "מעט",
-    "כן",
-    "לא",
-    "אחד",
-    "שניים",
-    "שלושה",
-]
+HEBREW_PROFILE = PhonoProfile.build(HEBREW_ONSETS, HEBREW_NUCLEI, HEBREW_CODAS)
+
+COMMON_HEBREW_WORDS = frozenset(
+    {
+        "שלום",
+        "תודה",
+        "בבקשה",
+        "בית",
+        "כלב",
+        "חתול",
+        "אישה",
+        "גבר",
+        "מים",
+        "אש",
+        "אוויר",
+        "אדמה",
+        "חבר",
+        "חברה",
+        "לילה",
+        "יום",
+        "זמן",
+        "עבודה",
+        "עולם",
+        "משפחה",
+        "אהבה",
+        "חיים",
+        "אמא",
+        "אבא",
+        "אח",
+        "אחות",
+        "הרבה",
+        "מעט",
+        "כן",
+        "לא",
+        "אחד",
+        "שניים",
+        "שלושה",
+    }
+)
 
 
-class HebrewLanguagePlugin(LanguagePlugin):
+class HebrewLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Modern Hebrew-flavored generator."""
 
     name = "hebrew"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            HEBREW_ONSETS,
-            HEBREW_NUCLEI,
-            HEBREW_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_HEBREW_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="he"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Hebrew; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = HEBREW_PROFILE
+    common_words = COMMON_HEBREW_WORDS
+    wordfreq_language = "he"
+    display_name = "Hebrew"
 
 
 __all__ = ["HebrewLanguagePlugin"]
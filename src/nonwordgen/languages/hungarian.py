@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-HUNGARIAN_ONSETS = [
+HUNGARIAN_ONSETS = (
     "",
     "b",
     "c",
@@ -46,9 +34,9 @@ HUNGARIAN_ONSETS = [
     "v",
     "z",
     "zs",
-]
+)
 
-HUNGARIAN_NUCLEI = [
+HUNGARIAN_NUCLEI = (
     "a",
     "e",
     "i",
@@ -68,9 +56,9 @@ HUNGARIAN_NUCLEI = [
     "io",
     "ua",
     "ue",
-]
+)
 
-HUNGARIAN_CODAS = [
+HUNGARIAN_CODAS = (
     "",
     "l",
     "n",
@@ -93,94 +81,59 @@ HUNGARIAN_CODAS = [
     "rs",
     "rt",
     "rm",
-]
+)
 
-COMMON_HUNGARIAN_WORDS = [
-    "szia",
-    "köszönöm",
-    "kérem",
-    "ház",
-    "kutya",
-    "macska",
-    "nő",
-    "férfi",
-    "víz",
-    "tűz",
-    "levegő",
-    "föld",
-    "barát",
-    "barátnő",
-    "éj",
-    "nap",
-    "idő",
-    "munka",
-    "világ",
-    "család",
-    "szerelem",
-    "élet",
-    "anya",
-    "apa",
-    "fiútestvér",
-    "lánytestvér",
-    "sok",
-    "kevés",
-    "igen",
-    "nem",
-    "egy",
-    "kettő",
-    "három",
-]
+HUNGARIAN_PROFILE = PhonoProfile.build(
+    HUNGARIAN_ONSETS, HUNGARIAN_NUCLEI, HUNGARIAN_CODAS
+)
+
+COMMON_HUNGARIAN_WORDS = frozenset(
+    {
+        "szia",
+        "köszönöm",
+        "kérem",
+        "ház",
+        "kutya",
+        "macska",
+        "nő",
+        "férfi",
+        "víz",
+        "tűz",
+        "levegő",
+        "föld",
+        "barát",
+        "barátnő",
+        "éj",
+        "nap",
+        "idő",
+        "munka",
+        "világ",
+        "család",
+        "szerelem",
+        "élet",
+        "anya",
+        "apa",
+        "fiútestvér",
+        "lánytestvér",
+        "sok",
+        "kevés",
+        "igen",
+        "nem",
+        "egy",
+        "kettő",
+        "három",
+    }
+)
 
 
-class HungarianLanguagePlugin(LanguagePlugin):
+class HungarianLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Hungarian-flavored generator."""
 
     name = "hungarian"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            HUNGARIAN_ONSETS,
-            HUNGARIAN_NUCLEI,
-            HUNGARIAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_HUNGARIAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="hu"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Hungarian; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = HUNGARIAN_PROFILE
+    common_words = COMMON_HUNGARIAN_WORDS
+    wordfreq_language = "hu"
+    display_name = "Hungarian"
 
 
 __all__ = ["HungarianLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-ITALIAN_ONSETS = [
+ITALIAN_ONSETS = (
     "",
     "b",
     "c",
@@ -51,9 +39,9 @@ ITALIAN_ONSETS = [
     "tr",
     "v",
     "z",
-]
+)
 
-ITALIAN_NUCLEI = [
+ITALIAN_NUCLEI = (
     "a",
     "e",
     "i",
@@ -73,9 +61,9 @@ ITALIAN_NUCLEI = [
     "oi",
     "ua",
     "ue",
-]
+)
 
-ITALIAN_CODAS = [
+ITALIAN_CODAS = (
     "",
     "l",
     "n",
@@ -90,94 +78,57 @@ ITALIAN_CODAS = [
     "no",
     "la",
     "ra",
-]
+)
 
-COMMON_ITALIAN_WORDS = [
-    "ciao",
-    "grazie",
-    "per favore",
-    "casa",
-    "cane",
-    "gatto",
-    "donna",
-    "uomo",
-    "acqua",
-    "fuoco",
-    "aria",
-    "terra",
-    "amico",
-    "amica",
-    "notte",
-    "giorno",
-    "tempo",
-    "lavoro",
-    "mondo",
-    "famiglia",
-    "amore",
-    "vita",
-    "madre",
-    "padre",
-    "fratello",
-    "sorella",
-    "molto",
-    "poco",
-    "sì",
-    "no",
-    "uno",
-    "due",
-    "tre",
-]
+ITALIAN_PROFILE = PhonoProfile.build(ITALIAN_ONSETS, ITALIAN_NUCLEI, ITALIAN_CODAS)
+
+COMMON_ITALIAN_WORDS = frozenset(
+    {
+        "ciao",
+        "grazie",
+        "per favore",
+        "casa",
+        "cane",
+        "gatto",
+        "donna",
+        "uomo",
+        "acqua",
+        "fuoco",
+        "aria",
+        "terra",
+        "amico",
+        "amica",
+        "notte",
+        "giorno",
+        "tempo",
+        "lavoro",
+        "mondo",
+        "famiglia",
+        "amore",
+        "vita",
+        "madre",
+        "padre",
+        "fratello",
+        "sorella",
+        "molto",
+        "poco",
+        "sì",
+        "no",
+        "uno",
+        "due",
+        "tre",
+    }
+)
 
 
-class ItalianLanguagePlugin(LanguagePlugin):
+class ItalianLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing an Italian-flavored generator."""
 
     name = "italian"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            ITALIAN_ONSETS,
-            ITALIAN_NUCLEI,
-            ITALIAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_ITALIAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="it"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Italian; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = ITALIAN_PROFILE
+    common_words = COMMON_ITALIAN_WORDS
+    wordfreq_language = "it"
+    display_name = "Italian"
 
 
 __all__ = ["ItalianLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-KOREAN_ONSETS = [
+KOREAN_ONSETS = (
     "",
     "ㄱ",
     "ㄲ",
@@ -39,9 +27,9 @@ KOREAN_ONSETS = [
     "ㅌ",
     "ㅍ",
     "ㅎ",
-]
+)
 
-KOREAN_NUCLEI = [
+KOREAN_NUCLEI = (
     "ㅏ",
     "ㅐ",
     "ㅑ",
@@ -63,9 +51,9 @@ KOREAN_NUCLEI = [
     "ㅡ",
     "ㅢ",
     "ㅣ",
-]
+)
 
-KOREAN_CODAS = [
+KOREAN_CODAS = (
     "",
     "ㄱ",
     "ㄲ",
@@ -94,90 +82,53 @@ KOREAN_CODAS = [
     "ㅌ",
     "ㅍ",
     "ㅎ",
-]
+)
 
-COMMON_KOREAN_WORDS = [
-    "안녕하세요",
-    "감사합니다",
-    "부탁합니다",
-    "집",
-    "강아지",
-    "고양이",
-    "여자",
-    "남자",
-    "물",
-    "불",
-    "공기",
-    "땅",
-    "친구",
-    "가족",
-    "시간",
-    "일",
-    "사랑",
-    "삶",
-    "어머니",
-    "아버지",
-    "형",
-    "누나",
-    "많이",
-    "조금",
-    "네",
-    "아니요",
-    "하나",
-    "둘",
-    "셋",
-]
+KOREAN_PROFILE = PhonoProfile.build(KOREAN_ONSETS, KOREAN_NUCLEI, KOREAN_CODAS)
+
+COMMON_KOREAN_WORDS = frozenset(
+    {
+        "안녕하세요",
+        "감사합니다",
+        "부탁합니다",
+        "집",
+        "강아지",
+        "고양이",
+        "여자",
+        "남자",
+        "물",
+        "불",
+        "공기",
+        "땅",
+        "친구",
+        "가족",
+        "시간",
+        "일",
+        "사랑",
+        "삶",
+        "어머니",
+        "아버지",
+        "형",
+        "누나",
+        "많이",
+        "조금",
+        "네",
+        "아니요",
+        "하나",
+        "둘",
+        "셋",
+    }
+)
 
 
-class KoreanLanguagePlugin(LanguagePlugin):
+class KoreanLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Korean-flavored generator."""
 
     name = "korean"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            KOREAN_ONSETS,
-            KOREAN_NUCLEI,
-            KOREAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_KOREAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="ko"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Korean; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = KOREAN_PROFILE
+    common_words = COMMON_KOREAN_WORDS
+    wordfreq_language = "ko"
+    display_name = "Korean"
 
 
 __all__ = ["KoreanLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-NORWEGIAN_ONSETS = [
+NORWEGIAN_ONSETS = (
     "",
     "b",
     "bl",
@@ -56,9 +44,9 @@ NORWEGIAN_ONSETS = [
     "t",
     "tr",
     "v",
-]
+)
 
-NORWEGIAN_NUCLEI = [
+NORWEGIAN_NUCLEI = (
     "a",
     "e",
     "i",
@@ -77,9 +65,9 @@ NORWEGIAN_NUCLEI = [
     "oi",
     "ua",
     "ue",
-]
+)
 
-NORWEGIAN_CODAS = [
+NORWEGIAN_CODAS = (
     "",
     "l",
     "n",
@@ -98,94 +86,59 @@ NORWEGIAN_CODAS = [
     "rs",
     "rt",
     "rm",
-]
+)
 
-COMMON_NORWEGIAN_WORDS = [
-    "hei",
-    "takk",
-    "vær så snill",
-    "hus",
-    "hund",
-    "katt",
-    "kvinne",
-    "mann",
-    "vann",
-    "ild",
-    "luft",
-    "jord",
-    "venn",
-    "venninne",
-    "natt",
-    "dag",
-    "tid",
-    "arbeid",
-    "verden",
-    "familie",
-    "kjærlighet",
-    "liv",
-    "mor",
-    "far",
-    "bror",
-    "søster",
-    "mye",
-    "lite",
-    "ja",
-    "nei",
-    "en",
-    "to",
-    "tre",
-]
+NORWEGIAN_PROFILE = PhonoProfile.build(
+    NORWEGIAN_ONSETS, NORWEGIAN_NUCLEI, NORWEGIAN_CODAS
+)
+
+COMMON_NORWEGIAN_WORDS = frozenset(
+    {
+        "hei",
+        "takk",
+        "vær så snill",
+        "hus",
+        "hund",
+        "katt",
+        "kvinne",
+        "mann",
+        "vann",
+        "ild",
+        "luft",
+        "jord",
+        "venn",
+        "venninne",
+        "natt",
+        "dag",
+        "tid",
+        "arbeid",
+        "verden",
+        "familie",
+        "kjærlighet",
+        "liv",
+        "mor",
+        "far",
+        "bror",
+        "søster",
+        "mye",
+        "lite",
+        "ja",
+        "nei",
+        "en",
+        "to",
+        "tre",
+    }
+)
 
 
-class NorwegianLanguagePlugin(LanguagePlugin):
+class NorwegianLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Norwegian-flavored generator."""
 
     name = "norwegian"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            NORWEGIAN_ONSETS,
-            NORWEGIAN_NUCLEI,
-            NORWEGIAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_NORWEGIAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="no"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Norwegian; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = NORWEGIAN_PROFILE
+    common_words = COMMON_NORWEGIAN_WORDS
+    wordfreq_language = "no"
+    display_name = "Norwegian"
 
 
 __all__ = ["NorwegianLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-PORTUGUESE_ONSETS = [
+PORTUGUESE_ONSETS = (
     "",
     "b",
     "br",
@@ -52,9 +40,9 @@ PORTUGUESE_ONSETS = [
     "tr",
     "v",
     "z",
-]
+)
 
-PORTUGUESE_NUCLEI = [
+PORTUGUESE_NUCLEI = (
     "a",
     "e",
     "i",
@@ -85,9 +73,9 @@ PORTUGUESE_NUCLEI = [
     "õe",
     "ou",
     "eu",
-]
+)
 
-PORTUGUESE_CODAS = [
+PORTUGUESE_CODAS = (
     "",
     "l",
     "m",
@@ -106,96 +94,61 @@ PORTUGUESE_CODAS = [
     "em",
     "ão",
     "ções",
-]
+)
 
-COMMON_PORTUGUESE_WORDS = [
-    "olá",
-    "adeus",
-    "obrigado",
-    "por",
-    "favor",
-    "casa",
-    "cachorro",
-    "gato",
-    "mulher",
-    "homem",
-    "água",
-    "terra",
-    "fogo",
-    "ar",
-    "amigo",
-    "amiga",
-    "noite",
-    "dia",
-    "trabalho",
-    "mundo",
-    "família",
-    "tempo",
-    "amor",
-    "vida",
-    "mãe",
-    "pai",
-    "irmão",
-    "irmã",
-    "muito",
-    "pouco",
-    "sim",
-    "não",
-    "um",
-    "dois",
-    "três",
-]
+PORTUGUESE_PROFILE = PhonoProfile.build(
+    PORTUGUESE_ONSETS, PORTUGUESE_NUCLEI, PORTUGUESE_CODAS
+)
+
+COMMON_PORTUGUESE_WORDS = frozenset(
+    {
+        "olá",
+        "adeus",
+        "obrigado",
+        "por",
+        "favor",
+        "casa",
+        "cachorro",
+        "gato",
+        "mulher",
+        "homem",
+        "água",
+        "terra",
+        "fogo",
+        "ar",
+        "amigo",
+        "amiga",
+        "noite",
+        "dia",
+        "trabalho",
+        "mundo",
+        "família",
+        "tempo",
+        "amor",
+        "vida",
+        "mãe",
+        "pai",
+        "irmão",
+        "irmã",
+        "muito",
+        "pouco",
+        "sim",
+        "não",
+        "um",
+        "dois",
+        "três",
+    }
+)
 
 
-class PortugueseLanguagePlugin(LanguagePlugin):
+class PortugueseLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Portuguese-flavored generator."""
 
     name = "portuguese"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            PORTUGUESE_ONSETS,
-            PORTUGUESE_NUCLEI,
-            PORTUGUESE_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_PORTUGUESE_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="pt"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Portuguese; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = PORTUGUESE_PROFILE
+    common_words = COMMON_PORTUGUESE_WORDS
+    wordfreq_language = "pt"
+    display_name = "Portuguese"
 
 
 __all__ = ["PortugueseLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-ROMANIAN_ONSETS = [
+ROMANIAN_ONSETS = (
     "",
     "b",
     "br",
@@ -55,9 +43,9 @@ ROMANIAN_ONSETS = [
     "tr",
     "v",
     "z",
-]
+)
 
-ROMANIAN_NUCLEI = [
+ROMANIAN_NUCLEI = (
     "a",
     "e",
     "i",
@@ -75,9 +63,9 @@ ROMANIAN_NUCLEI = [
     "oi",
     "ua",
     "ui",
-]
+)
 
-ROMANIAN_CODAS = [
+ROMANIAN_CODAS = (
     "",
     "l",
     "n",
@@ -95,94 +83,57 @@ ROMANIAN_CODAS = [
     "rs",
     "rt",
     "rm",
-]
+)
 
-COMMON_ROMANIAN_WORDS = [
-    "salut",
-    "mulțumesc",
-    "te rog",
-    "casă",
-    "câine",
-    "pisică",
-    "femeie",
-    "bărbat",
-    "apă",
-    "foc",
-    "aer",
-    "pământ",
-    "prieten",
-    "prietena",
-    "noapte",
-    "zi",
-    "timp",
-    "muncă",
-    "lume",
-    "familie",
-    "dragoste",
-    "viață",
-    "mamă",
-    "tată",
-    "frate",
-    "soră",
-    "mult",
-    "puțin",
-    "da",
-    "nu",
-    "unu",
-    "doi",
-    "trei",
-]
+ROMANIAN_PROFILE = PhonoProfile.build(ROMANIAN_ONSETS, ROMANIAN_NUCLEI, ROMANIAN_CODAS)
+
+COMMON_ROMANIAN_WORDS = frozenset(
+    {
+        "salut",
+        "mulțumesc",
+        "te rog",
+        "casă",
+        "câine",
+        "pisică",
+        "femeie",
+        "bărbat",
+        "apă",
+        "foc",
+        "aer",
+        "pământ",
+        "prieten",
+        "prietena",
+        "noapte",
+        "zi",
+        "timp",
+        "muncă",
+        "lume",
+        "familie",
+        "dragoste",
+        "viață",
+        "mamă",
+        "tată",
+        "frate",
+        "soră",
+        "mult",
+        "puțin",
+        "da",
+        "nu",
+        "unu",
+        "doi",
+        "trei",
+    }
+)
 
 
-class RomanianLanguagePlugin(LanguagePlugin):
+class RomanianLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Romanian-flavored generator."""
 
     name = "romanian"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            ROMANIAN_ONSETS,
-            ROMANIAN_NUCLEI,
-            ROMANIAN_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_ROMANIAN_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="ro"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Romanian; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = ROMANIAN_PROFILE
+    common_words = COMMON_ROMANIAN_WORDS
+    wordfreq_language = "ro"
+    display_name = "Romanian"
 
 
 __all__ = ["RomanianLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-SCB_ONSETS = [
+SCB_ONSETS = (
     "",
     "b",
     "bl",
@@ -59,9 +47,9 @@ SCB_ONSETS = [
     "v",
     "z",
     "ž",
-]
+)
 
-SCB_NUCLEI = [
+SCB_NUCLEI = (
     "a",
     "e",
     "i",
@@ -74,9 +62,9 @@ SCB_NUCLEI = [
     "oi",
     "ua",
     "ue",
-]
+)
 
-SCB_CODAS = [
+SCB_CODAS = (
     "",
     "l",
     "n",
@@ -100,93 +88,58 @@ SCB_CODAS = [
     "rs",
     "rt",
     "rm",
-]
+)
 
-COMMON_SCB_WORDS = [
-    "zdravo",
-    "hvala",
-    "molim",
-    "kuća",
-    "pas",
-    "mačka",
-    "žena",
-    "muškarac",
-    "voda",
-    "vatra",
-    "zrak",
-    "zemlja",
-    "prijatelj",
-    "prijateljica",
-    "noć",
-    "dan",
-    "vrijeme",
-    "posao",
-    "svijet",
-    "obitelj",
-    "ljubav",
-    "život",
-    "majka",
-    "otac",
-    "brat",
-    "sestra",
-    "mnogo",
-    "malo",
-    "da",
-    "ne",
-    "jedan",
-    "dva",
-    "tri",
-]
+SCB_PROFILE = PhonoProfile.build(SCB_ONSETS, SCB_NUCLEI, SCB_CODAS)
+
+COMMON_SCB_WORDS = frozenset(
+    {
+        "zdravo",
+        "hvala",
+        "molim",
+        "kuća",
+        "pas",
+        "mačka",
+        "žena",
+        "muškarac",
+        "voda",
+        "vatra",
+        "zrak",
+        "zemlja",
+        "prijatelj",
+        "prijateljica",
+        "noć",
+        "dan",
+        "vrijeme",
+        "posao",
+        "svijet",
+        "obitelj",
+        "ljubav",
+        "život",
+        "majka",
+        "otac",
+        "brat",
+        "sestra",
+        "mnogo",
+        "malo",
+        "da",
+        "ne",
+        "jedan",
+        "dva",
+        "tri",
+    }
+)
 
 
-class SCBLanguagePlugin(LanguagePlugin):
+class SCBLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Serbian/Croatian/Bosnian-flavored generator."""
 
     name = "scb"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            SCB_ONSETS,
-            SCB_NUCLEI,
-            SCB_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [StaticWordSetDictionary(COMMON_SCB_WORDS)]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            # Use Croatian as representative language code for frequencies
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="hr"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for SCB; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = SCB_PROFILE
+    common_words = COMMON_SCB_WORDS
+    # Use Croatian as representative language code for frequencies
+    wordfreq_language = "hr"
+    display_name = "SCB"
 
 
 __all__ = ["SCBLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-SPANISH_ONSETS = [
+SPANISH_ONSETS = (
     "",
     "b",
     "c",
@@ -52,9 +40,9 @@ SPANISH_ONSETS = [
     "v",
     "y",
     "z",
-]
+)
 
-SPANISH_NUCLEI = [
+SPANISH_NUCLEI = (
     "a",
     "e",
     "i",
@@ -77,9 +65,9 @@ SPANISH_NUCLEI = [
     "ua",
     "ue",
     "ui",
-]
+)
 
-SPANISH_CODAS = [
+SPANISH_CODAS = (
     "",
     "l",
     "n",
@@ -98,96 +86,59 @@ SPANISH_CODAS = [
     "rl",
     "rs",
     "rt",
-]
+)
 
-COMMON_SPANISH_WORDS = [
-    "hola",
-    "adiós",
-    "gracias",
-    "por",
-    "favor",
-    "casa",
-    "perro",
-    "gato",
-    "mujer",
-    "hombre",
-    "agua",
-    "tierra",
-    "fuego",
-    "aire",
-    "amigo",
-    "amiga",
-    "noche",
-    "día",
-    "trabajo",
-    "mundo",
-    "familia",
-    "tiempo",
-    "amor",
-    "vida",
-    "madre",
-    "padre",
-    "hermano",
-    "hermana",
-    "mucho",
-    "poco",
-    "sí",
-    "no",
-    "uno",
-    "dos",
-    "tres",
-]
+SPANISH_PROFILE = PhonoProfile.build(SPANISH_ONSETS, SPANISH_NUCLEI, SPANISH_CODAS)
+
+COMMON_SPANISH_WORDS = frozenset(
+    {
+        "hola",
+        "adiós",
+        "gracias",
+        "por",
+        "favor",
+        "casa",
+        "perro",
+        "gato",
+        "mujer",
+        "hombre",
+        "agua",
+        "tierra",
+        "fuego",
+        "aire",
+        "amigo",
+        "amiga",
+        "noche",
+        "día",
+        "trabajo",
+        "mundo",
+        "familia",
+        "tiempo",
+        "amor",
+        "vida",
+        "madre",
+        "padre",
+        "hermano",
+        "hermana",
+        "mucho",
+        "poco",
+        "sí",
+        "no",
+        "uno",
+        "dos",
+        "tres",
+    }
+)
 
 
-class SpanishLanguagePlugin(LanguagePlugin):
+class SpanishLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Spanish-flavored generator."""
 
     name = "spanish"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            SPANISH_ONSETS,
-            SPANISH_NUCLEI,
-            SPANISH_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_SPANISH_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="es"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Spanish; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = SPANISH_PROFILE
+    common_words = COMMON_SPANISH_WORDS
+    wordfreq_language = "es"
+    display_name = "Spanish"
 
 
 __all__ = ["SpanishLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-TURKISH_ONSETS = [
+TURKISH_ONSETS = (
     "",
     "b",
     "c",
@@ -47,9 +35,9 @@ TURKISH_ONSETS = [
     "kr",
     "pr",
     "tr",
-]
+)
 
-TURKISH_NUCLEI = [
+TURKISH_NUCLEI = (
     "a",
     "e",
     "ı",
@@ -68,9 +56,9 @@ TURKISH_NUCLEI = [
     "oi",
     "ua",
     "ue",
-]
+)
 
-TURKISH_CODAS = [
+TURKISH_CODAS = (
     "",
     "k",
     "l",
@@ -86,94 +74,57 @@ TURKISH_CODAS = [
     "rs",
     "rm",
     "nt",
-]
+)
 
-COMMON_TURKISH_WORDS = [
-    "merhaba",
-    "teşekkür",
-    "lütfen",
-    "ev",
-    "köpek",
-    "kedi",
-    "kadın",
-    "adam",
-    "su",
-    "ateş",
-    "hava",
-    "toprak",
-    "dost",
-    "arkadaş",
-    "gece",
-    "gündüz",
-    "zaman",
-    "çalışma",
-    "dünya",
-    "aile",
-    "aşk",
-    "hayat",
-    "anne",
-    "baba",
-    "kardeş",
-    "abla",
-    "çok",
-    "az",
-    "evet",
-    "hayır",
-    "bir",
-    "iki",
-    "üç",
-]
+TURKISH_PROFILE = PhonoProfile.build(TURKISH_ONSETS, TURKISH_NUCLEI, TURKISH_CODAS)
+
+COMMON_TURKISH_WORDS = frozenset(
+    {
+        "merhaba",
+        "teşekkür",
+        "lütfen",
+        "ev",
+        "köpek",
+        "kedi",
+        "kadın",
+        "adam",
+        "su",
+        "ateş",
+        "hava",
+        "toprak",
+        "dost",
+        "arkadaş",
+        "gece",
+        "gündüz",
+        "zaman",
+        "çalışma",
+        "dünya",
+        "aile",
+        "aşk",
+        "hayat",
+        "anne",
+        "baba",
+        "kardeş",
+        "abla",
+        "çok",
+        "az",
+        "evet",
+        "hayır",
+        "bir",
+        "iki",
+        "üç",
+    }
+)
 
 
-class TurkishLanguagePlugin(LanguagePlugin):
+class TurkishLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Turkish-flavored generator."""
 
     name = "turkish"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            TURKISH_ONSETS,
-            TURKISH_NUCLEI,
-            TURKISH_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_TURKISH_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="tr"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Turkish; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = TURKISH_PROFILE
+    common_words = COMMON_TURKISH_WORDS
+    wordfreq_language = "tr"
+    display_name = "Turkish"
 
 
 __all__ = ["TurkishLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-VIETNAMESE_ONSETS = [
+VIETNAMESE_ONSETS = (
     "",
     "b",
     "c",
@@ -43,9 +31,9 @@ VIETNAMESE_ONSETS = [
     "tr",
     "v",
     "x",
-]
+)
 
-VIETNAMESE_NUCLEI = [
+VIETNAMESE_NUCLEI = (
     "a",
     "à",
     "á",
@@ -123,9 +111,9 @@ VIETNAMESE_NUCLEI = [
     "ua",
     "uô",
     "ưa",
-]
+)
 
-VIETNAMESE_CODAS = [
+VIETNAMESE_CODAS = (
     "",
     "c",
     "ch",
@@ -135,99 +123,63 @@ VIETNAMESE_CODAS = [
     "nh",
     "p",
     "t",
-]
+)
 
-COMMON_VIETNAMESE_WORDS = [
-    "xin",
-    "chào",
-    "cảm",
-    "ơn",
-    "vui",
-    "lòng",
-    "nhà",
-    "chó",
-    "mèo",
-    "phụ",
-    "nữ",
-    "đàn",
-    "ông",
-    "nước",
-    "lửa",
-    "không",
-    "khí",
-    "đất",
-    "bạn",
-    "gia",
-    "đình",
-    "thời",
-    "gian",
-    "tình",
-    "yêu",
-    "cuộc",
-    "sống",
-    "mẹ",
-    "cha",
-    "anh",
-    "chị",
-    "nhiều",
-    "ít",
-    "có",
-    "không",
-    "một",
-    "hai",
-    "ba",
-]
+VIETNAMESE_PROFILE = PhonoProfile.build(
+    VIETNAMESE_ONSETS, VIETNAMESE_NUCLEI, VIETNAMESE_CODAS
+)
+
+COMMON_VIETNAMESE_WORDS = frozenset(
+    {
+        "xin",
+        "chào",
+        "cảm",
+        "ơn",
+        "vui",
+        "lòng",
+        "nhà",
+        "chó",
+        "mèo",
+        "phụ",
+        "nữ",
+        "đàn",
+        "ông",
+        "nước",
+        "lửa",
+        "không",
+        "khí",
+        "đất",
+        "bạn",
+        "gia",
+        "đình",
+        "thời",
+        "gian",
+        "tình",
+        "yêu",
+        "cuộc",
+        "sống",
+        "mẹ",
+        "cha",
+        "anh",
+        "chị",
+        "nhiều",
+        "ít",
+        "có",
+        "một",
+        "hai",
+        "ba",
+    }
+)
 
 
-class VietnameseLanguagePlugin(LanguagePlugin):
+class VietnameseLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Vietnamese-flavored generator."""
 
     name = "vietnamese"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            VIETNAMESE_ONSETS,
-            VIETNAMESE_NUCLEI,
-            VIETNAMESE_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_VIETNAMESE_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="vi"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Vietnamese; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = VIETNAMESE_PROFILE
+    common_words = COMMON_VIETNAMESE_WORDS
+    wordfreq_language = "vi"
+    display_name = "Vietnamese"
 
 
 __all__ = ["VietnameseLanguagePlugin"]
@@ -3,22 +3,10 @@
 
 from __future__ import annotations
 
-import logging
-import random
+from ..language_base import PhonotacticLanguagePlugin
+from ..phonotactics import PhonoProfile
 
-from ..dictionaries import (
-    CompositeDictionary,
-    StaticWordSetDictionary,
-    WordfreqDictionary,
-)
-from ..dictionary_base import DictionaryBackend
-from ..language_base import LanguagePlugin
-from ..phonotactics import build_candidate_from_profile
-from ..strictness import Strictness
-
-logger = logging.getLogger(__name__)
-
-YORUBA_ONSETS = [
+YORUBA_ONSETS = (
     "",
     "b",
     "d",
@@ -38,9 +26,9 @@ YORUBA_ONSETS = [
     "t",
     "w",
     "y",
-]
+)
 
-YORUBA_NUCLEI = [
+YORUBA_NUCLEI = (
     "a",
     "e",
     "ẹ",
@@ -62,93 +50,56 @@ YORUBA_NUCLEI = [
     "ọ́",
     "ù",
     "ú",
-]
+)
 
-YORUBA_CODAS = [
+YORUBA_CODAS = (
     "",
     "n",
-]
+)
 
-COMMON_YORUBA_WORDS = [
-    "bawo",
-    "ẹkáàrọ̀",
-    "ẹkáàsán",
-    "alafia",
-    "baba",
-    "ìyá",
-    "ọmọ",
-    "ilé",
-    "ọkọ",
-    "ọ̀rẹ́",
-    "ọrẹ",
-    "àpò",
-    "ọjà",
-    "ìwò",
-    "òkè",
-    "omi",
-    "ina",
-    "afẹ́fẹ́",
-    "aiyé",
-    "ọrun",
-    "òwúrọ̀",
-    "ìrọ̀lẹ́",
-    "ọ̀nà",
-    "ìfẹ́",
-    "àánú",
-    "ọjọ́",
-    "owó",
-]
+YORUBA_PROFILE = PhonoProfile.build(YORUBA_ONSETS, YORUBA_NUCLEI, YORUBA_CODAS)
+
+COMMON_YORUBA_WORDS = frozenset(
+    {
+        "bawo",
+        "ẹkáàrọ̀",
+        "ẹkáàsán",
+        "alafia",
+        "baba",
+        "ìyá",
+        "ọmọ",
+        "ilé",
+        "ọkọ",
+        "ọ̀rẹ́",
+        "ọrẹ",
+        "àpò",
+        "ọjà",
+        "ìwò",
+        "òkè",
+        "omi",
+        "ina",
+        "afẹ́fẹ́",
+        "aiyé",
+        "ọrun",
+        "òwúrọ̀",
+        "ìrọ̀lẹ́",
+        "ọ̀nà",
+        "ìfẹ́",
+        "àánú",
+        "ọjọ́",
+        "owó",
+    }
+)
 
 
-class YorubaLanguagePlugin(LanguagePlugin):
+class YorubaLanguagePlugin(PhonotacticLanguagePlugin):
     """Language plugin providing a Yoruba-flavored generator."""
 
     name = "yoruba"
-
-    def build_candidate(
-        self,
-        rng: random.Random,
-        min_syllables: int,
-        max_syllables: int,
-        max_length: int,
-    ) -> str:
-        return build_candidate_from_profile(
-            rng,
-            min_syllables,
-            max_syllables,
-            max_length,
-            YORUBA_ONSETS,
-            YORUBA_NUCLEI,
-            YORUBA_CODAS,
-        )
-
-    def build_dictionary(
-        self,
-        strictness: Strictness,
-        real_word_min_zipf: float = 2.7,
-    ) -> DictionaryBackend:
-        backends: list[DictionaryBackend] = [
-            StaticWordSetDictionary(COMMON_YORUBA_WORDS)
-        ]
-
-        if strictness in {Strictness.MEDIUM, Strictness.STRICT, Strictness.VERY_STRICT}:
-            threshold = real_word_min_zipf
-            if strictness == Strictness.VERY_STRICT:
-                threshold = min(real_word_min_zipf, 2.0)
-            wordfreq_backend = WordfreqDictionary(
-                real_word_min_zipf=threshold, language="yo"
-            )
-            if getattr(wordfreq_backend, "available", False):
-                backends.append(wordfreq_backend)
-            else:
-                logger.warning(
-                    "wordfreq backend unavailable for Yoruba; %s strictness is degraded.",
-                    strictness.value,
-                )
-
-        if len(backends) == 1:
-            return backends[0]
-        return CompositeDictionary(backends)
+    profile = YORUBA_PROFILE
+    common_words = COMMON_YORUBA_WORDS
+    wordfreq_language = "yo"
+    display_name = "Yoruba"
 
 
 __all__ = ["YorubaLanguagePlugin"]
@@ -4,9 +4,13 @@
 from __future__ import annotations
 
 import random
-from typing import Sequence
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
 
-ONSETS: Sequence[str] = [
+ONSETS: tuple[str, ...] = (
     "",
     "b",
     "c",
@@ -51,9 +55,9 @@ ONSETS: Sequence[str] = [
     "sh",
     "th",
     "wh",
-]
+)
 
-NUCLEI: Sequence[str] = [
+NUCLEI: tuple[str, ...] = (
     "a",
     "e",
     "i",
@@ -77,9 +81,9 @@ NUCLEI: Sequence[str] = [
     "ua",
     "ue",
     "ui",
-]
+)
 
-CODAS: Sequence[str] = [
+CODAS: tuple[str, ...] = (
     "",
     "b",
     "d",
@@ -123,34 +127,71 @@ CODAS: Sequence[str] = [
     "th",
     "ts",
     "ch",
-]
+)
 
 _MAX_PATTERN_ATTEMPTS = 8
 
 
-def _has_ugly_patterns(word: str) -> bool:
-    """Return True if the candidate contains obviously ugly character runs."""
-    lowered = word.lower()
+def longest_syllable(
+    onsets: Sequence[str], nuclei: Sequence[str], codas: Sequence[str]
+) -> int:
+    """Return the most characters a single onset+nucleus+coda can produce."""
+    return max(map(len, onsets)) + max(map(len, nuclei)) + max(map(len, codas))
+
+
+def _interned(pieces: Iterable[str]) -> tuple[str, ...]:
+    # NFC first, so pieces typed with decomposed marks (Hebrew points, Greek
+    # tonos, conjoining jamo) share one canonical, interned object.
+    return tuple(sys.intern(unicodedata.normalize("NFC", piece)) for piece in pieces)
+
+
+def _all_lowercase(*pools: Sequence[str]) -> bool:
+    return all(piece == piece.lower() for pool in pools for piece in pool)
+
+
+@dataclass(frozen=True, slots=True)
+class PhonoProfile:
+    """Immutable onset/nucleus/coda inventory for one language.
+
+    ``lowercase`` records that every piece is already lowercase, so joined
+    candidates can skip ``str.lower()``.
+    """
+
+    onsets: tuple[str, ...]
+    nuclei: tuple[str, ...]
+    codas: tuple[str, ...]
+    lowercase: bool = False
+
+    @classmethod
+    def build(
+        cls,
+        onsets: Iterable[str],
+        nuclei: Iterable[str],
+        codas: Iterable[str],
+    ) -> PhonoProfile:
+        """Return a profile holding NFC-normalized, interned tuples of pieces."""
+        pools = (_interned(onsets), _interned(nuclei), _interned(codas))
+        return cls(*pools, lowercase=_all_lowercase(*pools))
+
+    @property
+    def longest_syllable(self) -> int:
+        """Return the most characters one syllable of this profile can produce."""
+        return longest_syllable(self.onsets, self.nuclei, self.codas)
+
+
+# Any character three times in a row (which covers "yyy"), or "qq". One
+# C-level regex scan is about twice as fast as a Python loop over the word.
+_UGLY_RUN = re.compile(r"(.)\1\1|qq", re.DOTALL)
+
+
+def _has_ugly_patterns(lowered: str) -> bool:
+    """Return True if the lowercased candidate contains ugly character runs."""
     if len(lowered) < 3:
         return False
-    for idx in range(len(lowered) - 2):
-        if lowered[idx] == lowered[idx + 1] == lowered[idx + 2]:
-            return True
-    if "qq" in lowered or "yyy" in lowered:
-        return True
-    return False
+    return _UGLY_RUN.search(lowered) is not None
 
 
-def build_candidate_from_profile(
-    rng: random.Random,
-    min_syllables: int,
-    max_syllables: int,
-    max_length: int,
-    onsets: Sequence[str],
-    nuclei: Sequence[str],
-    codas: Sequence[str],
-) -> str:
-    """Build a candidate word using the provided syllable profile."""
+def _check_limits(min_syllables: int, max_syllables: int, max_length: int) -> None:
     if min_syllables < 1:
         raise ValueError("min_syllables must be at least 1.")
     if min_syllables > max_syllables:
@@ -158,16 +199,28 @@ def build_candidate_from_profile(
     if max_length < 1:
         raise ValueError("max_length must be at least 1.")
 
+
+def _assemble(
+    choice: Callable[[Sequence[str]], str],
+    randint: Callable[[int, int], int],
+    min_syllables: int,
+    max_syllables: int,
+    max_length: int,
+    onsets: Sequence[str],
+    nuclei: Sequence[str],
+    codas: Sequence[str],
+    lowercase: bool,
+) -> str:
     last_candidate = ""
     for _ in range(_MAX_PATTERN_ATTEMPTS):
-        syllable_target = rng.randint(min_syllables, max_syllables)
+        syllable_target = randint(min_syllables, max_syllables)
         pieces: list[str] = []
         length_so_far = 0
 
         for _ in range(syllable_target):
-            onset = rng.choice(onsets)
-            nucleus = rng.choice(nuclei)
-            coda = rng.choice(codas)
+            onset = choice(onsets)
+            nucleus = choice(nuclei)
+            coda = choice(codas)
             syllable = f"{onset}{nucleus}{coda}"
             projected_length = length_so_far + len(syllable)
             if projected_length > max_length and pieces:
@@ -177,7 +230,9 @@ def build_candidate_from_profile(
             if length_so_far >= max_length:
                 break
 
-        candidate = "".join(pieces).lower()
+        candidate = "".join(pieces)
+        if not lowercase:
+            candidate = candidate.lower()
         if len(candidate) > max_length:
             candidate = candidate[:max_length]
         if not candidate:
@@ -187,7 +242,69 @@ def build_candidate_from_profile(
         if not _has_ugly_patterns(candidate):
             return candidate
 
-    return last_candidate or rng.choice(nuclei).lower()
+    return last_candidate or choice(nuclei).lower()
+
+
+def build_candidate_from_profile(
+    rng: random.Random,
+    min_syllables: int,
+    max_syllables: int,
+    max_length: int,
+    onsets: Sequence[str],
+    nuclei: Sequence[str],
+    codas: Sequence[str],
+    *,
+    lowercase: bool = False,
+) -> str:
+    """Build a candidate word using the provided syllable profile.
+
+    Pass ``lowercase=True`` only when every piece is already lowercase (see
+    ``PhonoProfile.lowercase``); the candidate is then not lowercased again.
+    """
+    _check_limits(min_syllables, max_syllables, max_length)
+    return _assemble(
+        rng.choice,
+        rng.randint,
+        min_syllables,
+        max_syllables,
+        max_length,
+        onsets,
+        nuclei,
+        codas,
+        lowercase,
+    )
+
+
+def build_candidates_from_profile(
+    rng: random.Random,
+    count: int,
+    min_syllables: int,
+    max_syllables: int,
+    max_length: int,
+    onsets: Sequence[str],
+    nuclei: Sequence[str],
+    codas: Sequence[str],
+    *,
+    lowercase: bool = False,
+) -> list[str]:
+    """Build *count* candidates, validating limits and binding the RNG once."""
+    _check_limits(min_syllables, max_syllables, max_length)
+    choice = rng.choice
+    randint = rng.randint
+    return [
+        _assemble(
+            choice,
+            randint,
+            min_syllables,
+            max_syllables,
+            max_length,
+            onsets,
+            nuclei,
+            codas,
+            lowercase,
+        )
+        for _ in range(count)
+    ]
 
 
 def build_candidate(
@@ -208,4 +325,10 @@ def build_candidate(
     )
 
 
-__all__ = ["build_candidate", "build_candidate_from_profile"]
+__all__ = [
+    "PhonoProfile",
+    "build_candidate",
+    "build_candidate_from_profile",
+    "build_candidates_from_profile",
+    "longest_syllable",
+]
@@ -32,8 +32,9 @@ def generate_sentence(
     if not words:
         return ""
     words[0] = words[0].capitalize()
-    punct = rng.choice(PUNCTUATION)
-    return " ".join(words) + punct
+    # Attach the punctuation before joining so the sentence is built once.
+    words[-1] += rng.choice(PUNCTUATION)
+    return " ".join(words)
 
 
 def generate_sentences(
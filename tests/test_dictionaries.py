@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
+import math
+
 import nonwordgen.dictionaries as dictionaries_module
 import pytest
 from nonwordgen.dictionaries import (
     BuiltinCommonWordsDictionary,
     CompositeDictionary,
+    StaticWordSetDictionary,
     WordfreqDictionary,
 )
 from nonwordgen.dictionary_base import DictionaryBackend
@@ -24,6 +27,7 @@ class FakeDictionary(DictionaryBackend):
 def test_builtin_common_words_dictionary() -> None:
     backend = BuiltinCommonWordsDictionary()
     assert backend.is_real_word("the")
+    assert backend.is_real_word("The")
     assert not backend.is_real_word("florm")
 
 
@@ -33,6 +37,100 @@ def test_composite_dictionary_prefers_any_match() -> None:
     assert not comp.is_real_word("snarp")
 
 
+@pytest.mark.parametrize("size", [1, 2, 3, 4])
+def test_composite_dictionary_any_match_for_each_size(size: int) -> None:
+    backends = [FakeDictionary({f"word{idx}"}) for idx in range(size)]
+    comp = CompositeDictionary(backends)
+    for idx in range(size):
+        assert comp.is_real_word(f"word{idx}")
+    assert not comp.is_real_word("snarp")
+
+
+def test_composite_dictionary_normalizes_case_once() -> None:
+    comp = CompositeDictionary([BuiltinCommonWordsDictionary()])
+    assert comp.is_real_word("The")
+    assert comp.is_real_word("WATER")
+
+
+def test_composite_dictionary_queries_cheapest_backend_first() -> None:
+    calls: list[str] = []
+
+    class RecordingDictionary(FakeDictionary):
+        def __init__(self, label: str, cost: int) -> None:
+            super().__init__(set())
+            self.label = label
+            self.COST = cost
+
+        def is_real_word(self, word: str) -> bool:
+            calls.append(self.label)
+            return False
+
+    comp = CompositeDictionary(
+        [RecordingDictionary("slow", 2), RecordingDictionary("fast", 0)],
+        memoize=True,
+    )
+    assert not comp.is_real_word("snarp")
+    assert calls == ["fast", "slow"]
+    assert isinstance(comp.backends, tuple)
+
+    # Repeated queries are answered from the memo without touching backends.
+    assert not comp.is_real_word("SNARP")
+    assert calls == ["fast", "slow"]
+
+
+def test_composite_dictionary_sees_changes_to_mutable_backends() -> None:
+    class MutableDictionary:
+        # Duck-typed backend without a COST attribute.
+        def __init__(self) -> None:
+            self.words: set[str] = set()
+
+        def is_real_word(self, word: str) -> bool:
+            return word in self.words
+
+    mutable = MutableDictionary()
+    comp = CompositeDictionary([mutable])  # type: ignore[list-item]
+    assert not comp.is_real_word("florp")
+    mutable.words.add("florp")
+    assert comp.is_real_word("florp")
+
+
+def test_static_word_set_shares_lowercase_frozensets() -> None:
+    words = frozenset({"hallo", "wêreld"})
+    assert StaticWordSetDictionary(words)._words is words
+
+    mixed = StaticWordSetDictionary(frozenset({"Hallo"}))
+    assert mixed.is_real_word("hallo")
+    assert mixed.is_real_word("Hallo")
+
+
+def test_get_wordfreq_dictionary_shares_instances() -> None:
+    shared = dictionaries_module.get_wordfreq_dictionary("en", 2.7)
+    assert dictionaries_module.get_wordfreq_dictionary("en", 2.7) is shared
+    assert dictionaries_module.get_wordfreq_dictionary("en", 2.0) is not shared
+    assert shared.min_zipf == 2.7
+
+
+def test_standard_dictionary_degrades_to_common_words(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    from nonwordgen.languages import get_language_plugin
+    from nonwordgen.strictness import Strictness
+
+    plugin = get_language_plugin("thai")
+    loose = plugin.build_dictionary(Strictness.LOOSE)
+    assert isinstance(loose, StaticWordSetDictionary)
+
+    with caplog.at_level("WARNING", logger="nonwordgen.languages.thai"):
+        # wordfreq has no Thai tokenizer, so the common words stand alone.
+        strict = plugin.build_dictionary(Strictness.STRICT)
+    assert isinstance(strict, StaticWordSetDictionary)
+    assert any(
+        record.name == "nonwordgen.languages.thai"
+        and "unavailable for Thai" in record.getMessage()
+        for record in caplog.records
+    )
+
+
 def test_wordfreq_dictionary_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_zipf(word: str, lang: str) -> float:
         return 4.0 if word == "real" else 1.0
@@ -42,3 +140,79 @@ def test_wordfreq_dictionary_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
     assert backend.available
     assert backend.is_real_word("real")
     assert not backend.is_real_word("fake")
+
+
+def test_wordfreq_dictionary_switches_to_vocabulary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def fake_zipf(word: str, lang: str) -> float:
+        calls.append(word)
+        return 4.0 if word == "real" else 1.0
+
+    monkeypatch.setattr(dictionaries_module, "zipf_frequency", fake_zipf)
+    monkeypatch.setattr(dictionaries_module, "_VOCABULARY_AFTER_LOOKUPS", 1)
+    monkeypatch.setattr(
+        dictionaries_module,
+        "_load_vocabulary",
+        lambda language, wordlist, min_zipf: frozenset({"real", "strasse"}),
+    )
+    backend = WordfreqDictionary(real_word_min_zipf=2.5)
+    assert not backend.is_real_word("fake")
+    probes = len(calls)
+
+    assert backend.is_real_word("real")
+    assert backend.is_real_word("straße")
+    assert not backend.is_real_word("fake")
+    assert len(calls) == probes
+
+
+def test_load_vocabulary_keeps_words_at_or_above_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frequencies = {"often": 1e-4, "sometimes": 1e-6, "rarely": 1e-8}
+    info = {
+        "tokenizer": "regex",
+        "normal_form": "NFC",
+        "remove_marks": False,
+        "dotless_i": False,
+        "diacritics_under": None,
+        "transliteration": None,
+    }
+    # raising=False: these names are absent when wordfreq is not installed.
+    monkeypatch.setattr(
+        dictionaries_module,
+        "get_frequency_dict",
+        lambda lang, wordlist: frequencies,
+        raising=False,
+    )
+    monkeypatch.setattr(
+        dictionaries_module, "get_language_info", lambda lang: info, raising=False
+    )
+    monkeypatch.setattr(
+        dictionaries_module,
+        "freq_to_zipf",
+        lambda freq: round(math.log10(freq) + 9, 2),
+        raising=False,
+    )
+
+    load = dictionaries_module._load_vocabulary
+    assert load("xx", "best", 3.0) == {"often", "sometimes"}
+    assert load("xx", "best", 5.0) == {"often"}
+    assert load("xx", "best", 6.0) == frozenset()
+
+
+def test_wordfreq_dictionary_preload(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_zipf(word: str, lang: str) -> float:
+        return 1.0
+
+    monkeypatch.setattr(dictionaries_module, "zipf_frequency", fake_zipf)
+    monkeypatch.setattr(
+        dictionaries_module,
+        "_load_vocabulary",
+        lambda language, wordlist, min_zipf: frozenset({"real"}),
+    )
+    backend = WordfreqDictionary(real_word_min_zipf=2.5, preload=True)
+    assert backend.is_real_word("real")
+    assert not backend.is_real_word("fake")
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import random
 from typing import Iterable, Iterator, Optional, Sequence
 
@@ -139,6 +141,34 @@ def test_syllable_arguments_forwarded() -> None:
     assert captured == {"min": 2, "max": 4, "len": 9}
 
 
+def test_syllable_floor_skips_counts_too_short_for_min_length() -> None:
+    captured: list[int] = []
+
+    class ShortSyllablePlugin(StubLanguagePlugin):
+        max_syllable_length = 3
+
+        def build_candidate(
+            self,
+            rng: random.Random,
+            min_syllables: int,
+            max_syllables: int,
+            max_length: int,
+        ) -> str:
+            captured.append(min_syllables)
+            return "kadanim"
+
+    gen = WordGenerator(
+        min_length=7,
+        max_syllables=4,
+        allow_real_words=True,
+        rng=random.Random(0),
+        language_plugin=ShortSyllablePlugin([]),
+    )
+    gen.generate_one(max_attempts=1)
+    gen.generate_many(1)
+    assert captured == [3, 3]
+
+
 def test_dictionary_and_allow_real_words_flag() -> None:
     plugin_blocking = StubLanguagePlugin(["delta", "delta"])
     blocking = WordGenerator(
@@ -160,6 +190,97 @@ def test_dictionary_and_allow_real_words_flag() -> None:
     assert allowing.generate_one(max_attempts=1) == "delta"
 
 
+def test_generate_many_filters_batches_in_order() -> None:
+    plugin = StubLanguagePlugin(["zo", "florin", "drale", "florin", "mistral"])
+    gen = WordGenerator(
+        banned_words={"drale"},
+        allow_real_words=True,
+        rng=random.Random(0),
+        language_plugin=plugin,
+    )
+    assert gen.generate_many(2) == ["florin", "mistral"]
+
+
+def test_generate_iter_streams_and_validates_eagerly() -> None:
+    plugin = StubLanguagePlugin(["florin", "florin", "mistral", "drale"])
+    gen = WordGenerator(
+        allow_real_words=True, rng=random.Random(0), language_plugin=plugin
+    )
+    with pytest.raises(ValueError):
+        gen.generate_iter(0)
+    words = gen.generate_iter(3)
+    assert next(words) == "florin"
+    assert list(words) == ["mistral", "drale"]
+
+
+def test_generate_many_raises_when_attempts_exhausted() -> None:
+    gen = WordGenerator(
+        dictionary=AlwaysRealDictionary(),
+        rng=random.Random(0),
+        language_plugin=StubLanguagePlugin(["delta"] * 4),
+    )
+    with pytest.raises(RuntimeError):
+        gen.generate_many(2, max_attempts=4)
+
+
+def test_generate_many_unique_stops_when_candidates_are_exhausted() -> None:
+    gen = WordGenerator(
+        dictionary=AlwaysFalseDictionary(),
+        rng=random.Random(0),
+        language_plugin=StubLanguagePlugin(itertools.cycle(["delta", "gamma"])),
+    )
+    with pytest.raises(RuntimeError):
+        gen.generate_many(3, unique=True, max_attempts=50)
+
+
+def test_generator_queries_custom_dictionary_and_rebinds_it() -> None:
+    class CountingDictionary(AlwaysRealDictionary):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def is_real_word(self, word: str) -> bool:
+            self.calls += 1
+            return True
+
+    counting = CountingDictionary()
+    gen = WordGenerator(
+        dictionary=counting,
+        rng=random.Random(0),
+        language_plugin=StubLanguagePlugin(["delta"] * 3 + ["florin"]),
+    )
+    with pytest.raises(RuntimeError):
+        gen.generate_one(max_attempts=3)
+    # Custom backends may change between calls, so answers are not memoized.
+    assert counting.calls == 3
+
+    gen.dictionary = AlwaysFalseDictionary()
+    gen.banned_words = ["Florin"]
+    assert gen.banned_words == frozenset({"florin"})
+    with pytest.raises(RuntimeError):
+        gen.generate_one(max_attempts=1)
+
+
+def test_generators_share_cached_dictionary() -> None:
+    first = WordGenerator(strictness=Strictness.LOOSE, language="english")
+    second = WordGenerator(strictness=Strictness.LOOSE, language="english")
+    assert first._dictionary is second._dictionary
+
+
+def test_generator_accepts_unhashable_language_plugin() -> None:
+    from nonwordgen.languages.english import EnglishLanguagePlugin
+
+    @dataclasses.dataclass
+    class ConfiguredPlugin(EnglishLanguagePlugin):
+        label: str = "custom"
+
+    gen = WordGenerator(
+        strictness=Strictness.LOOSE,
+        rng=random.Random(0),
+        language_plugin=ConfiguredPlugin(),
+    )
+    assert gen.generate_one()
+
+
 def test_spanish_language_plugin_generates_words() -> None:
     gen = WordGenerator(
         allow_real_words=True, rng=random.Random(9876), language="spanish"
@@ -169,6 +290,26 @@ def test_spanish_language_plugin_generates_words() -> None:
     assert len(word) >= 2
 
 
+def test_language_plugins_load_once_and_custom_plugins_register() -> None:
+    from nonwordgen.languages import (
+        _REGISTERED_PLUGINS,
+        available_languages,
+        get_language_plugin,
+        register_language,
+    )
+
+    assert get_language_plugin("Thai") is get_language_plugin("thai")
+
+    plugin = StubLanguagePlugin(["zorp"])
+    plugin.name = "Klingon"
+    register_language(plugin)
+    try:
+        assert "klingon" in available_languages()
+        assert get_language_plugin("klingon") is plugin
+    finally:
+        del _REGISTERED_PLUGINS["klingon"]
+
+
 def test_available_languages_list() -> None:
     from nonwordgen import available_languages
 
@@ -277,6 +418,81 @@ def test_german_plugin_can_emit_umlauts() -> None:
     assert "ä" in word
 
 
+@pytest.mark.parametrize("language", ["english", "german"])
+def test_batch_builder_matches_single_candidates(language: str) -> None:
+    from nonwordgen.languages import get_language_plugin
+
+    plugin = get_language_plugin(language)
+    batch = plugin.build_candidates(random.Random(11), 50, 1, 3, 10)
+    rng = random.Random(11)
+    assert batch == [plugin.build_candidate(rng, 1, 3, 10) for _ in range(50)]
+
+
+def test_phonotactic_plugin_is_configured_by_data() -> None:
+    from nonwordgen.language_base import PhonotacticLanguagePlugin
+    from nonwordgen.phonotactics import PhonoProfile
+
+    class ToyLanguagePlugin(PhonotacticLanguagePlugin):
+        name = "toy"
+        profile = PhonoProfile.build(["k", "tr"], ["a"], ["", "n"])
+        common_words = frozenset({"kan"})
+        wordfreq_language = "xx"
+        display_name = "Toy"
+
+    plugin = ToyLanguagePlugin()
+    assert plugin.max_syllable_length == 4
+    word = plugin.build_candidate(random.Random(3), 2, 2, 8)
+    assert set(word) <= set("ktran")
+    dictionary = plugin.build_dictionary(Strictness.LOOSE)
+    assert dictionary.is_real_word("kan")
+    assert not dictionary.is_real_word("tran")
+
+
+def test_phono_profile_interns_tuple_pieces() -> None:
+    import sys
+
+    from nonwordgen.phonotactics import PhonoProfile
+
+    profile = PhonoProfile.build(["", "st"], ["ä"], ["n"])
+    assert profile.onsets == ("", "st")
+    assert profile.nuclei[0] is sys.intern("ä")
+    assert PhonoProfile.build([""], ["a\u0308"], [""]).nuclei[0] is profile.nuclei[0]
+    with pytest.raises(AttributeError):
+        profile.codas = ()  # type: ignore[misc]
+
+
+def test_lowercase_profile_skips_lowering_without_changing_output() -> None:
+    from nonwordgen.languages.german import GERMAN_PROFILE as profile
+    from nonwordgen.phonotactics import PhonoProfile, build_candidates_from_profile
+
+    assert not PhonoProfile.build(["St"], ["a"], [""]).lowercase
+    assert profile.lowercase
+    pools = (profile.onsets, profile.nuclei, profile.codas)
+    lowered = build_candidates_from_profile(random.Random(5), 50, 1, 3, 12, *pools)
+    skipped = build_candidates_from_profile(
+        random.Random(5), 50, 1, 3, 12, *pools, lowercase=True
+    )
+    assert skipped == lowered
+
+
+@pytest.mark.parametrize(
+    ("word", "ugly"),
+    [
+        ("brannt", False),
+        ("brrrat", True),
+        ("xyyyz", True),
+        ("aqqa", True),
+        ("qq", False),
+        ("ааа", True),
+        ("aabba", False),
+    ],
+)
+def test_has_ugly_patterns(word: str, ugly: bool) -> None:
+    from nonwordgen.phonotactics import _has_ugly_patterns
+
+    assert _has_ugly_patterns(word) is ugly
+
+
 def test_turkish_language_plugin_generates_words() -> None:
     gen = WordGenerator(
         allow_real_words=True,